@@ -21,6 +21,7 @@
 DistanceSensor::DistanceSensor()
     : m_fd(-1)
     , m_initialized(false)
+    , m_ranging(false)
     , m_last_distance(VL53L0X_MAX_MM)
 {
 }
@@ -103,7 +104,8 @@ DistanceSensor::Status DistanceSensor::readRange(uint16_t& distance_mm) {
         return Status::NOT_INITIALIZED;
     }
 
-    // Start single-shot measurement
+    // Start single-shot measurement (supersedes any pending startRange)
+    m_ranging = false;
     if (!writeReg8(REG_SYSRANGE_START, 0x01)) {
         return Status::ERROR;
     }
@@ -139,6 +141,47 @@ DistanceSensor::Status DistanceSensor::readRange(uint16_t& distance_mm) {
         return Status::TIMEOUT;
     }
 
+    return readResult(distance_mm);
+}
+
+DistanceSensor::Status DistanceSensor::startRange() {
+    if (!m_initialized || m_fd < 0) {
+        return Status::NOT_INITIALIZED;
+    }
+
+    if (!writeReg8(REG_SYSRANGE_START, 0x01)) {
+        m_ranging = false;
+        return Status::ERROR;
+    }
+
+    m_ranging = true;
+    return Status::OK;
+}
+
+DistanceSensor::Status DistanceSensor::pollRange(uint16_t& distance_mm) {
+    if (!m_initialized || m_fd < 0) {
+        return Status::NOT_INITIALIZED;
+    }
+
+    if (!m_ranging) {
+        return Status::ERROR;
+    }
+
+    // Single status read, no waiting
+    uint8_t status;
+    if (!readReg8(REG_RESULT_RANGE_STATUS, status)) {
+        m_ranging = false;
+        return Status::ERROR;
+    }
+    if ((status & 0x01) == 0) {
+        return Status::BUSY;
+    }
+
+    m_ranging = false;
+    return readResult(distance_mm);
+}
+
+DistanceSensor::Status DistanceSensor::readResult(uint16_t& distance_mm) {
     // Read range value (offset +10 from status register)
     if (!readReg16(REG_RESULT_RANGE_STATUS + 10, distance_mm)) {
         return Status::ERROR;
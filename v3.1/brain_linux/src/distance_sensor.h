@@ -31,7 +31,8 @@ public:
         TIMEOUT,
         OUT_OF_RANGE,
         ERROR,
-        NOT_INITIALIZED
+        NOT_INITIALIZED,
+        BUSY
     };
 
     DistanceSensor();
@@ -49,6 +50,19 @@ public:
      */
     Status readRange(uint16_t& distance_mm);
 
+    /**
+     * Start a single-shot measurement without waiting for it.
+     * Poll for the result with pollRange().
+     */
+    Status startRange();
+
+    /**
+     * Non-blocking check for the measurement started by startRange().
+     * @param distance_mm Output distance in millimeters
+     * @return BUSY while ranging is in progress, otherwise as readRange()
+     */
+    Status pollRange(uint16_t& distance_mm);
+
     /**
      * Get last valid distance reading.
      */
@@ -70,9 +84,11 @@ private:
     bool writeReg8(uint8_t reg, uint8_t value);
     bool readReg8(uint8_t reg, uint8_t& value);
     bool readReg16(uint8_t reg, uint16_t& value);
+    Status readResult(uint16_t& distance_mm);
 
     int m_fd;
     bool m_initialized;
+    bool m_ranging;
     uint16_t m_last_distance;
 };
 
@@ -43,12 +43,35 @@ extern "C" {
 #define HEARTBEAT_INTERVAL_MS     100
 #define MAX_CLIENTS               8
 #define RX_BUFFER_SIZE            4096
+#define EYE_PATH_MAX_POINTS       256   // Must fit in one RX_BUFFER_SIZE frame
+#define SERVO_SCRIPT_MAX_STEPS    128   // (channel, us, dwell_ms) triplets
 #define EYE_RECONNECT_INTERVAL_MS 5000
 #define WATCHDOG_LOG_INTERVAL_MS  10000
 #define STATS_LOG_INTERVAL_MS     30000
 #define DEFAULT_SERIAL_PORT       "/dev/ttyS0"
 #define DEFAULT_SERIAL_BAUD       115200
 
+/**
+ * WsBinaryMove - Binary "move" command (WebSocket binary frame, opcode 0x02)
+ *
+ * Layout (32 bytes, little-endian):
+ * Offset  Size  Field
+ * ------  ----  -----
+ *   0      2    magic (SPIDER_MAGIC, doubles as schema version)
+ *   2      4    t_ms (interpolation time to target)
+ *   6     26    servo_us[13] (CH0-12)
+ *
+ * Equivalent to {"type":"move","t_ms":...,"us":[...]} without JSON parsing.
+ */
+#pragma pack(push, 1)
+struct WsBinaryMove {
+    uint16_t magic;
+    uint32_t t_ms;
+    uint16_t servo_us[SERVO_COUNT_TOTAL];
+};
+#pragma pack(pop)
+static_assert(sizeof(WsBinaryMove) == 32, "WsBinaryMove must be 32 bytes");
+
 static std::atomic<bool> g_shutdown{false};
 static std::atomic<bool> g_estop{false};
 static std::atomic<bool> g_estop_prev{false};
@@ -87,6 +110,7 @@ private:
     void wsBroadcast(const std::string& msg);
     
     void handleCommand(const std::string& cmd);
+    void handleBinaryCommand(const uint8_t* payload, size_t len);
     void sendPosePacket(const PosePacket31& pkt);
     void tickHeartbeat();
     void tickEyeReconnect();
@@ -99,9 +123,14 @@ private:
     void handleEyeCommand(const std::string& cmd);
     void handleDistanceCommand(const std::string& cmd);
     void handleScanCommand(const std::string& cmd);
+    void handleSweepCommand(const std::string& cmd);
+    void tickSweep();
+    void tickEyePath();
+    void tickServoScript();
+    void tickDistanceBatch();
     
     void initScanController();
-    void setScanServoAngle(int angle_deg);
+    void setScanServoAngle(int angle_deg, int offset_us = 0);
     
     void onSerialServo(int channel, uint16_t us);
     void onSerialServos(const uint16_t* us, int count);
@@ -119,6 +148,50 @@ private:
     SerialControl m_serial_control;
     ScanController m_scan_controller;
     
+    // One-shot sweep requested over WebSocket, stepped from run()
+    struct SweepRequest {
+        bool active = false;
+        int min_deg = 0;
+        int max_deg = 180;
+        int steps = 9;
+        int delay_ms = 150;
+        int offset_us = 0;      // Scan servo calibration offset
+        int index = 0;
+        uint64_t next_ms = 0;
+        bool ranging = false;   // Reading at index started, polled from run()
+        uint64_t range_deadline_ms = 0;
+        int reply_id = -1;      // "id" of the sweep command, echoed in the result
+        std::vector<int> readings;  // -1 = failed reading
+        
+        int angle(int i) const {
+            return steps > 1 ? min_deg + i * (max_deg - min_deg) / (steps - 1) : min_deg;
+        }
+    };
+    SweepRequest m_sweep;
+    
+    // Batch of distance readings taken from run() at a fixed interval
+    struct DistanceBatch {
+        bool active = false;
+        int count = 0;
+        int interval_ms = 100;
+        uint64_t next_ms = 0;
+        int reply_id = -1;      // "id" of the batch command, echoed in the result
+        std::vector<int> readings;  // -1 = failed reading
+    };
+    DistanceBatch m_distance_batch;
+    
+    // Eye look path played back from run(): x0,y0,x1,y1,...
+    std::vector<float> m_eye_path;
+    size_t m_eye_path_idx = 0;
+    int m_eye_path_dt_ms = 33;
+    uint64_t m_eye_path_next_ms = 0;
+    
+    // Servo script played back from run(): ch0,us0,dwell0,ch1,us1,dwell1,...
+    uint16_t m_servo_script[SERVO_SCRIPT_MAX_STEPS * 3];
+    int m_servo_script_len = 0;
+    int m_servo_script_idx = 0;
+    uint64_t m_servo_script_next_ms = 0;
+    
     std::string m_serial_port = DEFAULT_SERIAL_PORT;
     int m_serial_baud = DEFAULT_SERIAL_BAUD;
     
@@ -126,6 +199,7 @@ private:
     std::vector<WsClient> m_clients;
     
     uint32_t m_seq = 0;
+    int m_reply_id = -1;  // "id" of the command being handled, echoed in replies
     uint64_t m_last_heartbeat_ms = 0;
     uint64_t m_last_eye_reconnect_ms = 0;
     uint64_t m_last_watchdog_log_ms = 0;
@@ -265,6 +339,10 @@ void BrainDaemon::run() {
         processClients();
         m_serial_control.tick();
         m_scan_controller.tick();
+        tickSweep();
+        tickEyePath();
+        tickServoScript();
+        tickDistanceBatch();
         tickHeartbeat();
         tickEyeReconnect();
         tickWatchdogLog();
@@ -460,6 +538,9 @@ void BrainDaemon::wsProcessFrame(WsClient& client) {
         if (opcode == 0x01 && fin) {
             std::string msg((char*)payload, payload_len);
             handleCommand(msg);
+            m_reply_id = -1;  // Later broadcasts are not replies to it
+        } else if (opcode == 0x02 && fin) {
+            handleBinaryCommand(payload, payload_len);
         } else if (opcode == 0x08) {
             LOG_DEBUG("WS", "Client sent close frame");
             wsSendFrame(client.fd, nullptr, 0, 0x08);
@@ -505,10 +586,18 @@ void BrainDaemon::wsSendFrame(int fd, const uint8_t* data, size_t len, uint8_t o
     }
 }
 
+// Prefix a JSON reply with {"id":N,...} so the sender can match it to its request
+static std::string withReplyId(const std::string& msg, int reply_id) {
+    if (reply_id < 0 || msg.empty() || msg[0] != '{') return msg;
+    return "{\"id\":" + std::to_string(reply_id) + "," + msg.substr(1);
+}
+
 void BrainDaemon::wsBroadcast(const std::string& msg) {
+    // Replies go to every client; the echoed id tells the sender which is its own
+    const std::string tagged = withReplyId(msg, m_reply_id);
     for (auto& client : m_clients) {
         if (client.handshake_done) {
-            wsSendFrame(client.fd, (const uint8_t*)msg.c_str(), msg.size());
+            wsSendFrame(client.fd, (const uint8_t*)tagged.c_str(), tagged.size());
         }
     }
 }
@@ -575,6 +664,35 @@ static bool parseJsonString(const std::string& json, const char* key, char* out,
     return true;
 }
 
+// Returns the number of values, or -1 if the array holds more than max_count
+static int parseJsonFloatArray(const std::string& json, const char* key, std::vector<float>& out, int max_count) {
+    std::string search = std::string("\"") + key + "\":";
+    size_t pos = json.find(search);
+    if (pos == std::string::npos) return 0;
+    pos = json.find('[', pos);
+    if (pos == std::string::npos) return 0;
+    
+    const char* p = json.c_str() + pos + 1;
+    out.clear();
+    while ((int)out.size() < max_count) {
+        while (*p == ' ' || *p == '\t' || *p == ',') p++;
+        if (*p == '\0' || *p == ']') break;
+        char* end = nullptr;
+        float val = strtof(p, &end);
+        if (end == p) break;
+        out.push_back(val);
+        p = end;
+    }
+    if ((int)out.size() == max_count) {
+        while (*p == ' ' || *p == '\t' || *p == ',') p++;
+        if (*p != '\0' && *p != ']') {
+            out.clear();  // Never act on a silently truncated array
+            return -1;
+        }
+    }
+    return (int)out.size();
+}
+
 static int servoNameToChannel(const char* name) {
     static const char* names[] = {
         "leg0_coxa", "leg0_femur",
@@ -608,10 +726,12 @@ static bool hasCmd(const std::string& json, const char* cmd_value) {
 
 void BrainDaemon::handleCommand(const std::string& cmd) {
     LOG_DEBUG("Brain", "Received: %s", cmd.c_str());
+    m_reply_id = parseJsonInt(cmd, "id", -1);
     
     if (hasCmd(cmd, "estop") || hasType(cmd, "estop")) {
         g_estop.store(true);
         m_mailbox.sendEstop();
+        m_servo_script_len = 0;
         wsBroadcast("{\"status\":\"estop_activated\"}");
         return;
     }
@@ -710,6 +830,74 @@ void BrainDaemon::handleCommand(const std::string& cmd) {
         return;
     }
     
+    // servos_partial: {"type":"servos_partial","channels":[0,1,2],"us":[1500,1500,1500]}
+    if (hasType(cmd, "servos_partial")) {
+        uint16_t channels[SERVO_COUNT_TOTAL];
+        uint16_t values[SERVO_COUNT_TOTAL];
+        int ch_count = parseJsonIntArray(cmd, "channels", channels, SERVO_COUNT_TOTAL);
+        int us_count = parseJsonIntArray(cmd, "us", values, SERVO_COUNT_TOTAL);
+        
+        if (ch_count == 0 || ch_count != us_count) {
+            char err[80];
+            snprintf(err, sizeof(err), "{\"error\":\"channel_us_mismatch\",\"channels\":%d,\"us\":%d}",
+                ch_count, us_count);
+            wsBroadcast(err);
+            return;
+        }
+        
+        for (int i = 0; i < ch_count; i++) {
+            if (channels[i] >= SERVO_COUNT_TOTAL) {
+                wsBroadcast("{\"error\":\"invalid_channel\"}");
+                return;
+            }
+        }
+        
+        for (int i = 0; i < ch_count; i++) {
+            m_current_servos[channels[i]] = clamp_servo_us(values[i]);
+        }
+        
+        uint16_t flags = FLAG_CLAMP_ENABLE;
+        if (g_estop.load()) flags |= FLAG_ESTOP;
+        PosePacket31 pkt = buildPosePacket(0, flags, m_current_servos);
+        sendPosePacket(pkt);
+        
+        char resp[48];
+        snprintf(resp, sizeof(resp), "{\"status\":\"ok\",\"count\":%d}", ch_count);
+        wsBroadcast(resp);
+        return;
+    }
+    
+    // servo_script: {"type":"servo_script","steps":[ch,us,dwell_ms,...]}
+    // Each step sets one servo, then waits dwell_ms; replaces a running script
+    if (hasType(cmd, "servo_script")) {
+        int n = parseJsonIntArray(cmd, "steps", m_servo_script, SERVO_SCRIPT_MAX_STEPS * 3);
+        if (n == 0 || n % 3 != 0) {
+            m_servo_script_len = 0;
+            wsBroadcast("{\"error\":\"invalid_servo_script\"}");
+            return;
+        }
+        
+        uint32_t duration_ms = 0;
+        for (int i = 0; i < n; i += 3) {
+            if (m_servo_script[i] >= SERVO_COUNT_TOTAL) {
+                m_servo_script_len = 0;
+                wsBroadcast("{\"error\":\"invalid_channel\"}");
+                return;
+            }
+            duration_ms += m_servo_script[i + 2];
+        }
+        
+        m_servo_script_len = n;
+        m_servo_script_idx = 0;
+        m_servo_script_next_ms = get_time_ms();
+        
+        char resp[80];
+        snprintf(resp, sizeof(resp), "{\"status\":\"ok\",\"steps\":%d,\"duration_ms\":%u}",
+            n / 3, duration_ms);
+        wsBroadcast(resp);
+        return;
+    }
+    
     if (hasType(cmd, "get_servos")) {
         std::string resp = "{\"servos\":[";
         for (int i = 0; i < SERVO_COUNT_TOTAL; i++) {
@@ -752,13 +940,14 @@ void BrainDaemon::handleCommand(const std::string& cmd) {
     
     // Eye commands - forward to Eye Service
     if (hasType(cmd, "eye") || hasType(cmd, "look") || hasType(cmd, "blink") ||
-        hasType(cmd, "wink") || hasType(cmd, "mood")) {
+        hasType(cmd, "wink") || hasType(cmd, "mood") || hasType(cmd, "eye_path")) {
         handleEyeCommand(cmd);
         return;
     }
     
-    // Distance sensor command
-    if (hasType(cmd, "distance")) {
+    // Distance sensor commands (blocking read, or non-blocking start/poll)
+    if (hasType(cmd, "distance") || hasType(cmd, "distance_start") ||
+        hasType(cmd, "distance_poll") || hasType(cmd, "distance_batch")) {
         handleDistanceCommand(cmd);
         return;
     }
@@ -785,6 +974,12 @@ void BrainDaemon::handleCommand(const std::string& cmd) {
         return;
     }
     
+    // One-shot sweep: {"type":"sweep","min":0,"max":180,"steps":9,"delay_ms":150}
+    if (hasType(cmd, "sweep")) {
+        handleSweepCommand(cmd);
+        return;
+    }
+    
     // Autonomous scan controller commands
     if (hasType(cmd, "scan_start") || hasType(cmd, "scan_stop") ||
         hasType(cmd, "scan_status") || hasType(cmd, "scan_get_data")) {
@@ -795,6 +990,33 @@ void BrainDaemon::handleCommand(const std::string& cmd) {
     wsBroadcast("{\"error\":\"unknown_command\"}");
 }
 
+void BrainDaemon::handleBinaryCommand(const uint8_t* payload, size_t len) {
+    WsBinaryMove move;
+    if (len != sizeof(move)) {
+        wsBroadcast("{\"error\":\"invalid_binary_length\"}");
+        return;
+    }
+    memcpy(&move, payload, sizeof(move));
+    
+    if (move.magic != SPIDER_MAGIC) {
+        wsBroadcast("{\"error\":\"invalid_binary_magic\"}");
+        return;
+    }
+    
+    for (int i = 0; i < SERVO_COUNT_TOTAL; i++) {
+        m_current_servos[i] = clamp_servo_us(move.servo_us[i]);
+    }
+    
+    uint16_t flags = FLAG_CLAMP_ENABLE;
+    if (g_estop.load()) flags |= FLAG_ESTOP;
+    PosePacket31 pkt = buildPosePacket(move.t_ms, flags, m_current_servos);
+    sendPosePacket(pkt);
+    
+    char resp[64];
+    snprintf(resp, sizeof(resp), "{\"status\":\"ok\",\"t_ms\":%u,\"seq\":%u}", move.t_ms, pkt.seq);
+    wsBroadcast(resp);
+}
+
 void BrainDaemon::handleEyeCommand(const std::string& cmd) {
     auto eyeCommandFailed = [this]() {
         if (m_eye_connected) {
@@ -804,8 +1026,36 @@ void BrainDaemon::handleEyeCommand(const std::string& cmd) {
         wsBroadcast("{\"error\":\"eye_service_unavailable\"}");
     };
     
+    // eye_path: {"type":"eye_path","dt_ms":33,"xy":[x0,y0,x1,y1,...]}
+    // Points are played back from run() at dt_ms; a new path replaces the old one
+    if (hasType(cmd, "eye_path")) {
+        int dt_ms = parseJsonInt(cmd, "dt_ms", 33);
+        int n = parseJsonFloatArray(cmd, "xy", m_eye_path, EYE_PATH_MAX_POINTS * 2);
+        if (n < 0) {
+            char err[64];
+            snprintf(err, sizeof(err), "{\"error\":\"eye_path_too_long\",\"max_points\":%d}",
+                EYE_PATH_MAX_POINTS);
+            wsBroadcast(err);
+            return;
+        }
+        if (n < 2 || (n & 1) || dt_ms < 1) {
+            m_eye_path.clear();
+            wsBroadcast("{\"error\":\"invalid_eye_path\"}");
+            return;
+        }
+        m_eye_path_idx = 0;
+        m_eye_path_dt_ms = dt_ms;
+        m_eye_path_next_ms = get_time_ms();
+        
+        char resp[64];
+        snprintf(resp, sizeof(resp), "{\"status\":\"ok\",\"eye\":\"path\",\"points\":%d}", n / 2);
+        wsBroadcast(resp);
+        return;
+    }
+    
     // look: {"type":"look","x":0.0,"y":0.0} or {"type":"eye","look":{"x":0.0,"y":0.0}}
     if (hasType(cmd, "look")) {
+        m_eye_path.clear();  // Direct look cancels a running path
         float x = 0.0f, y = 0.0f;
         const char* px = strstr(cmd.c_str(), "\"x\":");
         const char* py = strstr(cmd.c_str(), "\"y\":");
@@ -889,19 +1139,60 @@ void BrainDaemon::handleEyeCommand(const std::string& cmd) {
 }
 
 void BrainDaemon::handleDistanceCommand(const std::string& cmd) {
-    (void)cmd;
-    
     if (!m_distance_available) {
         LOG_DEBUG("Distance", "Distance command received but sensor unavailable");
         wsBroadcast("{\"error\":\"distance_sensor_not_available\"}");
         return;
     }
     
+    // distance_batch: {"type":"distance_batch","n":10,"interval_ms":100}
+    // Readings are taken from run(); one reply carries all of them
+    if (hasType(cmd, "distance_batch")) {
+        if (m_distance_batch.active || m_sweep.active || m_scan_controller.isRunning()) {
+            wsBroadcast("{\"type\":\"distance_batch\",\"status\":\"busy\"}");
+            return;
+        }
+        int n = parseJsonInt(cmd, "n", 10);
+        int interval_ms = parseJsonInt(cmd, "interval_ms", 100);
+        if (n < 1 || n > 1000 || interval_ms < 0) {
+            wsBroadcast("{\"error\":\"invalid_distance_batch\"}");
+            return;
+        }
+        m_distance_batch.active = true;
+        m_distance_batch.count = n;
+        m_distance_batch.interval_ms = interval_ms;
+        m_distance_batch.next_ms = get_time_ms();
+        m_distance_batch.reply_id = m_reply_id;
+        m_distance_batch.readings.clear();
+        return;
+    }
+    
+    // distance_start: {"type":"distance_start"} - trigger ranging, don't wait
+    if (hasType(cmd, "distance_start")) {
+        if (m_distance_sensor.startRange() == DistanceSensor::Status::OK) {
+            wsBroadcast("{\"type\":\"distance_start\",\"status\":\"ok\"}");
+        } else {
+            LOG_WARN("Distance", "Failed to start ranging");
+            wsBroadcast("{\"type\":\"distance_start\",\"status\":\"error\"}");
+        }
+        return;
+    }
+    
     uint16_t distance_mm = 0;
-    DistanceSensor::Status status = m_distance_sensor.readRange(distance_mm);
+    DistanceSensor::Status status;
+    if (hasType(cmd, "distance_poll")) {
+        // distance_poll: {"type":"distance_poll"} - "busy" until result is ready
+        status = m_distance_sensor.pollRange(distance_mm);
+    } else {
+        status = m_distance_sensor.readRange(distance_mm);
+    }
     
     char resp[128];
     switch (status) {
+    case DistanceSensor::Status::BUSY:
+        snprintf(resp, sizeof(resp), 
+            "{\"type\":\"distance\",\"status\":\"busy\"}");
+        break;
     case DistanceSensor::Status::OK:
         snprintf(resp, sizeof(resp), 
             "{\"type\":\"distance\",\"distance_mm\":%u,\"status\":\"ok\"}", 
@@ -1167,9 +1458,9 @@ void BrainDaemon::initScanController() {
     LOG_INFO("Scan", "Controller initialized (not started)");
 }
 
-void BrainDaemon::setScanServoAngle(int angle_deg) {
+void BrainDaemon::setScanServoAngle(int angle_deg, int offset_us) {
     // Convert angle (0-180) to microseconds (500-2500)
-    int us = 500 + (angle_deg * 2000 / 180);
+    int us = 500 + (angle_deg * 2000 / 180) + offset_us;
     if (us < SERVO_PWM_MIN_US) us = SERVO_PWM_MIN_US;
     if (us > SERVO_PWM_MAX_US) us = SERVO_PWM_MAX_US;
     
@@ -1243,6 +1534,164 @@ void BrainDaemon::handleScanCommand(const std::string& cmd) {
     }
 }
 
+void BrainDaemon::tickEyePath() {
+    if (m_eye_path.empty() || get_time_ms() < m_eye_path_next_ms) return;
+    
+    if (!m_eye_client.lookAt(m_eye_path[m_eye_path_idx], m_eye_path[m_eye_path_idx + 1])) {
+        LOG_WARN("Eye", "Eye path aborted: Eye Service unavailable");
+        m_eye_path.clear();
+        return;
+    }
+    
+    m_eye_path_idx += 2;
+    if (m_eye_path_idx >= m_eye_path.size()) {
+        m_eye_path.clear();
+        return;
+    }
+    // Absolute schedule so lookAt() time doesn't stretch the cadence
+    m_eye_path_next_ms += m_eye_path_dt_ms;
+}
+
+void BrainDaemon::tickServoScript() {
+    if (m_servo_script_idx >= m_servo_script_len || get_time_ms() < m_servo_script_next_ms) return;
+    
+    const uint16_t* step = m_servo_script + m_servo_script_idx;
+    m_current_servos[step[0]] = clamp_servo_us(step[1]);
+    
+    uint16_t flags = FLAG_CLAMP_ENABLE;
+    if (g_estop.load()) flags |= FLAG_ESTOP;
+    PosePacket31 pkt = buildPosePacket(0, flags, m_current_servos);
+    sendPosePacket(pkt);
+    
+    m_servo_script_idx += 3;
+    // Absolute schedule so IPC time doesn't stretch the dwell
+    m_servo_script_next_ms += step[2];
+}
+
+void BrainDaemon::tickDistanceBatch() {
+    DistanceBatch& batch = m_distance_batch;
+    if (!batch.active || get_time_ms() < batch.next_ms) return;
+    
+    // scan_start took the sensor mid-batch: give up rather than interleave reads
+    if (m_scan_controller.isRunning()) {
+        batch.active = false;
+        wsBroadcast(withReplyId("{\"type\":\"distance_batch\",\"status\":\"busy\"}", batch.reply_id));
+        return;
+    }
+    
+    uint16_t distance_mm = 0;
+    bool ok = m_distance_sensor.readRange(distance_mm) == DistanceSensor::Status::OK;
+    batch.readings.push_back(ok ? (int)distance_mm : -1);
+    
+    if ((int)batch.readings.size() < batch.count) {
+        batch.next_ms += batch.interval_ms;
+        return;
+    }
+    
+    batch.active = false;
+    int valid = 0, min_mm = 0, max_mm = 0;
+    long sum = 0;
+    std::string msg = "{\"type\":\"distance_batch\",\"status\":\"ok\",\"readings\":[";
+    for (size_t i = 0; i < batch.readings.size(); i++) {
+        int d = batch.readings[i];
+        if (i > 0) msg += ",";
+        if (d < 0) {
+            msg += "null";
+            continue;
+        }
+        msg += std::to_string(d);
+        if (valid == 0 || d < min_mm) min_mm = d;
+        if (valid == 0 || d > max_mm) max_mm = d;
+        sum += d;
+        valid++;
+    }
+    msg += "]";
+    if (valid > 0) {
+        char stats[96];
+        snprintf(stats, sizeof(stats), ",\"min\":%d,\"max\":%d,\"avg\":%.1f",
+            min_mm, max_mm, (double)sum / valid);
+        msg += stats;
+    }
+    msg += "}";
+    wsBroadcast(withReplyId(msg, batch.reply_id));
+}
+
+void BrainDaemon::handleSweepCommand(const std::string& cmd) {
+    if (!m_distance_available) {
+        wsBroadcast("{\"error\":\"distance_sensor_not_available\"}");
+        return;
+    }
+    if (m_sweep.active || m_distance_batch.active || m_scan_controller.isRunning()) {
+        wsBroadcast("{\"type\":\"sweep\",\"status\":\"busy\"}");
+        return;
+    }
+    
+    int min_deg = parseJsonInt(cmd, "min", 0);
+    int max_deg = parseJsonInt(cmd, "max", 180);
+    int steps = parseJsonInt(cmd, "steps", 9);
+    int delay_ms = parseJsonInt(cmd, "delay_ms", 150);
+    if (min_deg < 0 || max_deg > 180 || min_deg > max_deg ||
+        steps < 1 || steps > 181 || delay_ms < 0) {
+        wsBroadcast("{\"error\":\"invalid_sweep\"}");
+        return;
+    }
+    
+    m_sweep.active = true;
+    m_sweep.min_deg = min_deg;
+    m_sweep.max_deg = max_deg;
+    m_sweep.steps = steps;
+    m_sweep.delay_ms = delay_ms;
+    m_sweep.offset_us = parseJsonInt(cmd, "offset_us", 0);
+    m_sweep.index = 0;
+    m_sweep.ranging = false;
+    m_sweep.reply_id = m_reply_id;
+    m_sweep.readings.clear();
+    
+    setScanServoAngle(m_sweep.angle(0), m_sweep.offset_us);
+    m_sweep.next_ms = get_time_ms() + delay_ms;
+}
+
+void BrainDaemon::tickSweep() {
+    uint64_t now = get_time_ms();
+    if (!m_sweep.active || now < m_sweep.next_ms) return;
+    
+    // Start ranging once the servo has settled, then poll on later ticks
+    // instead of blocking run() for the whole measurement
+    uint16_t distance_mm = 0;
+    DistanceSensor::Status status;
+    if (!m_sweep.ranging) {
+        status = m_distance_sensor.startRange();
+        if (status == DistanceSensor::Status::OK) {
+            m_sweep.ranging = true;
+            m_sweep.range_deadline_ms = now + VL53L0X_TIMEOUT_MS;
+            return;
+        }
+    } else {
+        status = m_distance_sensor.pollRange(distance_mm);
+        if (status == DistanceSensor::Status::BUSY) {
+            if (now < m_sweep.range_deadline_ms) return;
+            status = DistanceSensor::Status::TIMEOUT;
+        }
+        m_sweep.ranging = false;
+    }
+    m_sweep.readings.push_back(status == DistanceSensor::Status::OK ? (int)distance_mm : -1);
+    
+    if (++m_sweep.index < m_sweep.steps) {
+        setScanServoAngle(m_sweep.angle(m_sweep.index), m_sweep.offset_us);
+        m_sweep.next_ms = get_time_ms() + m_sweep.delay_ms;
+        return;
+    }
+    
+    m_sweep.active = false;
+    std::string msg = "{\"type\":\"sweep\",\"status\":\"ok\",\"readings\":[";
+    for (size_t i = 0; i < m_sweep.readings.size(); i++) {
+        if (i > 0) msg += ",";
+        msg += m_sweep.readings[i] < 0 ? "null" : std::to_string(m_sweep.readings[i]);
+    }
+    msg += "]}";
+    wsBroadcast(withReplyId(msg, m_sweep.reply_id));
+}
+
 static void print_usage(const char* prog) {
     std::cout << "Usage: " << prog << " [options]\n"
               << "Options:\n"
@@ -12,6 +12,7 @@ Calibration range: -30° to +30° (from limits.h CALIB_OFFSET_MIN/MAX_DEG)
 import json
 import os
 import sys
+import time
 from pathlib import Path
 from typing import Dict, List, Optional, Any
 
@@ -228,7 +229,6 @@ class CalibrationTool:
             
             elif cmd == 't':
                 print("Test sweep: 60° -> 90° -> 120°")
-                import time
                 for angle in [60, 90, 120, 90]:
                     base_us = int(500 + (angle / 180.0) * 2000)
                     us = base_us + deg_to_us_offset(temp_offset)
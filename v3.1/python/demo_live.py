@@ -31,7 +31,7 @@ def demo_system():
     
     print()
     print("--- Step 2: Get Current Servo Positions ---")
-    resp = client.send_command({"type": "get_servos"})
+    resp = client.send_command({"type": "get_servos"}, expect_response=True)
     if resp:
         print(f"Servos: {resp}")
     else:
@@ -19,10 +19,12 @@ Usage:
 """
 
 import time
+import random
 import logging
+from array import array
 from enum import Enum, auto
 from dataclasses import dataclass, field
-from typing import List, Tuple, Optional, Callable
+from typing import Dict, List, Tuple, Optional, Callable
 
 try:
     from spider_client import SpiderClient
@@ -31,6 +33,9 @@ except ImportError:
 
 logger = logging.getLogger(__name__)
 
+# Sentinel stored in ScanData.distances for a failed reading
+NO_READING = -1
+
 
 class Action(Enum):
     """Recommended navigation action based on obstacle detection."""
@@ -44,35 +49,40 @@ class Action(Enum):
 
 @dataclass
 class ScanData:
-    """Results from an environment scan."""
+    """
+    Results from an environment scan.
+    
+    Distances are stored as a compact int16 array in mm, with
+    NO_READING (-1) marking a failed reading.
+    """
     angles: List[float] = field(default_factory=list)
-    distances: List[Optional[int]] = field(default_factory=list)
+    distances: array = field(default_factory=lambda: array('h'))
     timestamp: float = 0.0
     
     @property
     def valid_readings(self) -> List[Tuple[float, int]]:
-        """Return only valid (non-None) readings as (angle, distance) pairs."""
-        return [(a, d) for a, d in zip(self.angles, self.distances) if d is not None]
+        """Return only valid readings as (angle, distance) pairs."""
+        return [(a, d) for a, d in zip(self.angles, self.distances) if d >= 0]
     
     @property
     def min_distance(self) -> Optional[int]:
         """Return the minimum distance from all readings."""
-        valid = [d for d in self.distances if d is not None]
-        return min(valid) if valid else None
+        return min((d for d in self.distances if d >= 0), default=None)
     
     @property
     def max_distance(self) -> Optional[int]:
         """Return the maximum distance from all readings."""
-        valid = [d for d in self.distances if d is not None]
-        return max(valid) if valid else None
+        dmax = max(self.distances, default=NO_READING)
+        return dmax if dmax >= 0 else None
     
     def get_distance_at_angle(self, target_angle: float) -> Optional[int]:
-        """Get distance reading closest to a given angle."""
+        """Get distance reading closest to a given angle (None if invalid)."""
         if not self.angles:
             return None
         closest_idx = min(range(len(self.angles)), 
                          key=lambda i: abs(self.angles[i] - target_angle))
-        return self.distances[closest_idx]
+        dist = self.distances[closest_idx]
+        return dist if dist >= 0 else None
     
     def get_center_distance(self) -> Optional[int]:
         """Get distance reading at center (90°)."""
@@ -101,7 +111,17 @@ class ObstacleAvoidance:
     DEFAULT_SCAN_MIN_ANGLE = 30.0   # Don't scan behind legs
     DEFAULT_SCAN_MAX_ANGLE = 150.0
     DEFAULT_SCAN_STEPS = 9
-    DEFAULT_SCAN_DELAY = 0.12       # Servo settle time
+    DEFAULT_SCAN_DELAY = 0.12       # Servo settle time for a 90° move
+    DEFAULT_SCAN_SETTLE_MIN = 0.02  # Minimum settle time (sensor freshness)
+    RANGING_OVERLAP = 0.4           # Fraction of settle time overlapped with ranging
+    RANGING_TIMEOUT = 0.1           # Max wait for a non-blocking reading
+    RANGING_POLL_INTERVAL = 0.005
+    SIM_POOL_SIZE = 1024            # Pre-generated simulated readings
+    DEFAULT_HEADING = 90.0          # Straight ahead, when no reading is usable
+    
+    # ASCII render lookup tables
+    _STATUS_TABLE = (" !! CRITICAL", " ! WARNING", " ~ CAUTION", "")
+    _DIR_TABLE = ("R", "C", "L")  # Indexed by (angle > 95) + (angle >= 85)
     
     def __init__(self, client: 'SpiderClient'):
         """
@@ -122,11 +142,17 @@ class ObstacleAvoidance:
         self.scan_max_angle = self.DEFAULT_SCAN_MAX_ANGLE
         self.scan_steps = self.DEFAULT_SCAN_STEPS
         self.scan_delay = self.DEFAULT_SCAN_DELAY
+        self.scan_settle_min = self.DEFAULT_SCAN_SETTLE_MIN
         
         # State
         self._last_scan: Optional[ScanData] = None
+        self._scan_angle: Optional[float] = None  # Last settled angle (None = unknown)
         self._sensor_available = True
+        self._async_ranging = True  # Cleared if Brain lacks distance_start
         self._simulate = False
+        self._sim_pool: List[int] = []
+        self._sim_idx = 0
+        self._penalty_by_n: Dict[int, Tuple[int, ...]] = {}  # find_best_direction cache
         
         # Eye integration callbacks
         self._on_scan_angle: Optional[Callable[[float], None]] = None
@@ -142,6 +168,13 @@ class ObstacleAvoidance:
         """Enable simulation mode (no hardware required)."""
         self._simulate = enabled
         if enabled:
+            if not self._sim_pool:
+                # Simulate with occasional obstacles
+                self._sim_pool = [
+                    random.randint(80, 200) if random.random() < 0.1
+                    else random.randint(400, 1200)
+                    for _ in range(self.SIM_POOL_SIZE)
+                ]
             logger.info("Obstacle avoidance running in simulation mode")
     
     def set_eye_callbacks(self, 
@@ -163,11 +196,9 @@ class ObstacleAvoidance:
     def _get_distance(self) -> Optional[int]:
         """Get distance reading with graceful degradation."""
         if self._simulate:
-            import random
-            # Simulate with occasional obstacles
-            if random.random() < 0.1:
-                return random.randint(80, 200)
-            return random.randint(400, 1200)
+            idx = self._sim_idx
+            self._sim_idx = (idx + 1) % self.SIM_POOL_SIZE
+            return self._sim_pool[idx]
         
         if not self._sensor_available:
             return None
@@ -192,6 +223,68 @@ class ObstacleAvoidance:
         except Exception as e:
             logger.warning(f"Scan servo error: {e}")
     
+    def _wait_scan_settled(self, angle: float, fraction: float = 1.0):
+        """
+        Wait for the scan servo to reach the given angle.
+        
+        Uses the client's settle signal if it provides one, otherwise
+        sleeps proportionally to the travel from the previous angle.
+        fraction < 1.0 returns early so the caller can overlap work
+        with the tail of the settle time.
+        """
+        travel = 90.0 if self._scan_angle is None else abs(angle - self._scan_angle)
+        self._scan_angle = angle
+        
+        wait_settled = getattr(self.client, 'wait_scan_settled', None)
+        if wait_settled is not None:
+            wait_settled()
+            return
+        
+        time.sleep(max(self.scan_settle_min, self.scan_delay * travel / 90.0) * fraction)
+    
+    def _settle_and_measure(self, angle: float) -> Optional[int]:
+        """
+        Wait for the scan servo to settle and read distance.
+        
+        If the client supports non-blocking ranging, the measurement is
+        started before the settle time has fully elapsed and polled for,
+        overlapping sensor integration with the end of servo travel.
+        """
+        if not (self._async_ranging and self._sensor_available and
+                hasattr(self.client, 'start_distance_measurement')):
+            self._wait_scan_settled(angle)
+            return self._get_distance()
+        
+        self._wait_scan_settled(angle, 1.0 - self.RANGING_OVERLAP)
+        
+        try:
+            started = self.client.start_distance_measurement()
+        except Exception as e:
+            logger.warning(f"Distance start error: {e}")
+            started = False
+        
+        if not started:
+            # Fall back to blocking reads for the rest of the session
+            logger.info("Non-blocking ranging unavailable, using blocking reads")
+            self._async_ranging = False
+            return self._get_distance()
+        
+        deadline = time.monotonic() + self.RANGING_TIMEOUT
+        while True:
+            try:
+                done, distance = self.client.poll_distance()
+            except Exception as e:
+                logger.warning(f"Distance poll error: {e}")
+                return None
+            if done:
+                if distance is None:
+                    logger.debug("Distance sensor returned None")
+                return distance
+            if time.monotonic() >= deadline:
+                logger.debug("Distance poll timeout")
+                return None
+            time.sleep(self.RANGING_POLL_INTERVAL)
+    
     def check_front(self) -> Tuple[bool, Optional[int]]:
         """
         Quick check of distance directly ahead.
@@ -202,7 +295,7 @@ class ObstacleAvoidance:
         """
         if not self._simulate:
             self._set_scan_angle(90.0)  # Center
-            time.sleep(self.scan_delay)
+            self._wait_scan_settled(90.0)
         
         distance = self._get_distance()
         
@@ -213,10 +306,14 @@ class ObstacleAvoidance:
         
         is_safe = distance > self.critical_distance
         
-        if not is_safe and self._on_obstacle_detected:
-            self._on_obstacle_detected(distance)
-        elif is_safe and distance > self.safe_distance and self._on_path_clear:
-            self._on_path_clear()
+        if not is_safe:
+            on_obstacle = self._on_obstacle_detected
+            if on_obstacle:
+                on_obstacle(distance)
+        elif distance > self.safe_distance:
+            on_clear = self._on_path_clear
+            if on_clear:
+                on_clear()
         
         return (is_safe, distance)
     
@@ -238,38 +335,91 @@ class ObstacleAvoidance:
             # Single reading at center
             scan_data.angles = [90.0]
             _, dist = self.check_front()
-            scan_data.distances = [dist]
+            scan_data.distances.append(NO_READING if dist is None else dist)
             self._last_scan = scan_data
             return scan_data
         
-        step_size = (self.scan_max_angle - self.scan_min_angle) / (num_steps - 1)
+        min_angle = self.scan_min_angle
+        step_size = (self.scan_max_angle - min_angle) / (num_steps - 1)
+        simulate = self._simulate
+        on_scan_angle = self._on_scan_angle
+        set_scan_angle = self._set_scan_angle
+        get_distance = self._get_distance
+        settle_and_measure = self._settle_and_measure
+        angles_append = scan_data.angles.append
+        distances_append = scan_data.distances.append
         
         for i in range(num_steps):
-            angle = self.scan_min_angle + i * step_size
-            scan_data.angles.append(angle)
+            angle = min_angle + i * step_size
+            angles_append(angle)
             
             # Move scan servo
-            self._set_scan_angle(angle)
+            set_scan_angle(angle)
             
             # Eye tracking callback
-            if self._on_scan_angle:
-                self._on_scan_angle(angle)
-            
-            time.sleep(self.scan_delay if not self._simulate else 0.02)
+            if on_scan_angle:
+                on_scan_angle(angle)
             
-            # Read distance
-            distance = self._get_distance()
-            scan_data.distances.append(distance)
+            # Wait for servo and read distance
+            if simulate:
+                time.sleep(0.02)
+                distance = get_distance()
+            else:
+                distance = settle_and_measure(angle)
+            distances_append(NO_READING if distance is None else distance)
             
             logger.debug(f"Scan {angle:.1f}°: {distance}mm")
         
-        # Return to center
-        if not self._simulate:
+        # Return to center (settle is accounted for by the next check_front)
+        if not simulate:
             self._set_scan_angle(90.0)
         
         self._last_scan = scan_data
         return scan_data
     
+    def _deviation_penalties(self, num_steps: int) -> Tuple[int, ...]:
+        """Get (cached) center-deviation penalty per scan index."""
+        penalties = self._penalty_by_n.get(num_steps)
+        if penalties is None:
+            center_idx = num_steps // 2
+            penalties = tuple(abs(i - center_idx) * 15 for i in range(num_steps))
+            self._penalty_by_n[num_steps] = penalties
+        return penalties
+    
+    def _iter_scores(self, data: ScanData):
+        """
+        Yield (index, angle, distance, score) for each reading.
+        
+        Invalid readings get a score of -inf. Shared by find_best_direction
+        and format_scan_ascii so rendering and scoring take one pass.
+        """
+        distances = data.distances
+        last_idx = len(distances) - 1
+        penalties = self._deviation_penalties(len(data.angles))
+        
+        for i, (angle, dist) in enumerate(zip(data.angles, distances)):
+            if dist < 0:
+                yield i, angle, dist, float('-inf')
+                continue
+            
+            # Base score from distance
+            score = float(dist)
+            
+            # Bonus for wide clearance (check neighbors)
+            if i > 0:
+                prev = distances[i - 1]
+                if prev >= 0:
+                    score += prev * 0.25
+            if i < last_idx:
+                nxt = distances[i + 1]
+                if nxt >= 0:
+                    score += nxt * 0.25
+            
+            # Small penalty for deviation from center (prefer going straight)
+            score -= penalties[i]
+            
+            yield i, angle, dist, score
+    
     def find_best_direction(self, scan_data: Optional[ScanData] = None) -> float:
         """
         Analyze scan data to find the best heading angle.
@@ -289,34 +439,21 @@ class ObstacleAvoidance:
         
         if data is None or not data.angles:
             logger.warning("No scan data available, defaulting to center")
-            return 90.0
+            return self.DEFAULT_HEADING
         
-        best_idx = 0
+        best_idx = None
         best_score = float('-inf')
         
-        for i, dist in enumerate(data.distances):
-            if dist is None:
-                continue
-            
-            # Base score from distance
-            score = float(dist)
-            
-            # Bonus for wide clearance (check neighbors)
-            if i > 0 and data.distances[i-1] is not None:
-                score += data.distances[i-1] * 0.25
-            if i < len(data.distances) - 1 and data.distances[i+1] is not None:
-                score += data.distances[i+1] * 0.25
-            
-            # Small penalty for deviation from center (prefer going straight)
-            center_idx = len(data.angles) // 2
-            deviation_penalty = abs(i - center_idx) * 15
-            score -= deviation_penalty
-            
+        for i, _, _, score in self._iter_scores(data):
             if score > best_score:
                 best_score = score
                 best_idx = i
         
-        best_angle = data.angles[best_idx] if data.angles else 90.0
+        if best_idx is None:
+            logger.warning("No valid readings in scan, defaulting to center")
+            return self.DEFAULT_HEADING
+        
+        best_angle = data.angles[best_idx]
         logger.debug(f"Best direction: {best_angle:.1f}° (score: {best_score:.0f})")
         
         return best_angle
@@ -403,20 +540,22 @@ class ObstacleAvoidance:
         if self._last_scan is None:
             return (Action.FORWARD, 0.0)
         
-        # Split scan into left and right halves
-        left_distances = []
-        right_distances = []
-        
+        # Split scan into left and right halves (running sums, no temp lists)
+        left_sum = right_sum = 0
+        left_n = right_n = 0
+
         for angle, dist in zip(self._last_scan.angles, self._last_scan.distances):
-            if dist is None:
+            if dist < 0:
                 continue
             if angle > 90:
-                left_distances.append(dist)
+                left_sum += dist
+                left_n += 1
             else:
-                right_distances.append(dist)
-        
-        left_avg = sum(left_distances) / len(left_distances) if left_distances else 0
-        right_avg = sum(right_distances) / len(right_distances) if right_distances else 0
+                right_sum += dist
+                right_n += 1
+
+        left_avg = left_sum / left_n if left_n else 0
+        right_avg = right_sum / right_n if right_n else 0
         
         total = left_avg + right_avg
         if total == 0:
@@ -484,42 +623,64 @@ class ObstacleAvoidance:
         if data is None or not data.angles:
             return "No scan data available"
         
-        lines = []
-        lines.append("Scan Result:")
-        lines.append("-" * 45)
+        lines = ["Scan Result:", "-" * 45]
         
         max_dist = data.max_distance or 1000
+        best_idx = None  # Stays None if every reading is invalid
+        best_score = float('-inf')
         
-        for angle, dist in zip(data.angles, data.distances):
-            if dist is None:
+        # Render rows and pick the best direction in the same pass
+        for i, angle, dist, score in self._iter_scores(data):
+            if score > best_score:
+                best_score = score
+                best_idx = i
+            
+            if dist < 0:
                 bar = "??? (no reading)"
             else:
                 bar_len = int((dist / max_dist) * 25)
                 bar = "#" * bar_len
                 
-                # Add threshold markers
-                if dist <= self.critical_distance:
-                    status = " !! CRITICAL"
-                elif dist <= self.warning_distance:
-                    status = " ! WARNING"
-                elif dist <= self.safe_distance:
-                    status = " ~ CAUTION"
-                else:
-                    status = ""
-                bar += status
+                # Add threshold marker (tier = number of thresholds exceeded)
+                tier = ((dist > self.critical_distance) +
+                        (dist > self.warning_distance) +
+                        (dist > self.safe_distance))
+                bar += self._STATUS_TABLE[tier]
             
-            direction = "L" if angle > 95 else ("R" if angle < 85 else "C")
-            lines.append(f"{angle:6.1f}°[{direction}]: {dist if dist else '---':>5} {bar}")
+            direction = self._DIR_TABLE[(angle > 95) + (angle >= 85)]
+            lines.append(f"{angle:6.1f}°[{direction}]: {dist if dist > 0 else '---':>5} {bar}")
         
         lines.append("-" * 45)
         
-        best_angle = self.find_best_direction(data)
-        best_dist = data.get_distance_at_angle(best_angle)
+        # Same fallback as find_best_direction() so both report one heading
+        if best_idx is None:
+            best_angle, best_dist = self.DEFAULT_HEADING, None
+        else:
+            best_angle, best_dist = data.angles[best_idx], data.distances[best_idx]
         lines.append(f"Best direction: {best_angle:.1f}° @ {best_dist}mm")
         
         return "\n".join(lines)
 
 
+def _avoider_client(host: str, port: int) -> 'SpiderClient':
+    """Create the (not yet connected) client for the factories below."""
+    if SpiderClient is None:
+        raise ImportError("spider_client module not found")
+    return SpiderClient(host=host, port=port)
+
+
+def _avoider_setup(client: 'SpiderClient', connected: bool,
+                   simulate: bool) -> Tuple[Optional['SpiderClient'], ObstacleAvoidance]:
+    """Finish factory setup once the connection attempt is done."""
+    if not connected and not simulate:
+        raise ConnectionError(f"Failed to connect to Spider Brain at {client.host}:{client.port}")
+    
+    oa = ObstacleAvoidance(client)
+    oa.set_simulate(simulate)
+    
+    return (client, oa)
+
+
 def create_obstacle_avoider(host: str = "192.168.42.1", port: int = 9000, 
                            simulate: bool = False) -> Tuple[Optional['SpiderClient'], ObstacleAvoidance]:
     """
@@ -528,28 +689,28 @@ def create_obstacle_avoider(host: str = "192.168.42.1", port: int = 9000,
     Args:
         host: Spider Brain IP address
         port: Spider Brain port
-        simulate: If True, don't require real hardware
+        simulate: If True, don't require real hardware (a failed
+            connection is ignored)
         
     Returns:
         Tuple of (client, obstacle_avoidance)
         client may be None if simulate=True and connection fails
     """
-    if SpiderClient is None:
-        raise ImportError("spider_client module not found")
-    
-    client = SpiderClient(host=host, port=port)
-    
-    if not simulate:
-        if not client.connect():
-            raise ConnectionError(f"Failed to connect to Spider Brain at {host}:{port}")
-    else:
-        # Try to connect but don't fail if it doesn't work
-        try:
-            client.connect()
-        except Exception:
-            pass
+    client = _avoider_client(host, port)
+    return _avoider_setup(client, client.connect(), simulate)
+
+
+async def create_obstacle_avoider_async(host: str = "192.168.42.1", port: int = 9000,
+                                        simulate: bool = False
+                                        ) -> Tuple[Optional['SpiderClient'], ObstacleAvoidance]:
+    """
+    Async variant of create_obstacle_avoider().
     
-    oa = ObstacleAvoidance(client)
-    oa.set_simulate(simulate)
+    The connection handshake runs off the event loop, so callers can
+    overlap it with other setup, e.g.:
     
-    return (client, oa)
+        (client, oa), eyes = await asyncio.gather(
+            create_obstacle_avoider_async(host), init_eyes_async())
+    """
+    client = _avoider_client(host, port)
+    return _avoider_setup(client, await client.connect_async(), simulate)
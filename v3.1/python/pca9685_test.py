@@ -22,13 +22,18 @@ SERVO_FREQ = 50  # Hz (standard for servos)
 SERVO_MIN_US = 500   # microseconds
 SERVO_MAX_US = 2500  # microseconds
 
+# Prescaler for SERVO_FREQ with the 25MHz internal oscillator
+PRESCALE_VAL = int(25000000.0 / (4096 * SERVO_FREQ) - 1)
+
 class PCA9685:
     def __init__(self, bus_num=1, addr=PCA9685_ADDR):
         self.addr = addr
         try:
             import smbus2 as smbus
+            self._i2c_msg = smbus.i2c_msg
         except ImportError:
             import smbus
+            self._i2c_msg = None  # python-smbus has no combined transactions
         self.bus = smbus.SMBus(bus_num)
         self._init_pca9685()
 
@@ -38,19 +43,26 @@ class PCA9685:
         self.bus.write_byte_data(self.addr, MODE1, 0x80)
         time.sleep(0.01)
         
-        # Set frequency
-        prescale = int(25000000.0 / (4096 * SERVO_FREQ) - 1)
-        
-        # Sleep mode to set prescaler
+        # Sleep mode to set prescaler, then wake (order matters, no delay needed)
         old_mode = self.bus.read_byte_data(self.addr, MODE1)
-        self.bus.write_byte_data(self.addr, MODE1, (old_mode & 0x7F) | 0x10)
-        self.bus.write_byte_data(self.addr, PRESCALE, prescale)
-        self.bus.write_byte_data(self.addr, MODE1, old_mode)
+        writes = [
+            (MODE1, (old_mode & 0x7F) | 0x10),
+            (PRESCALE, PRESCALE_VAL),
+            (MODE1, old_mode),
+        ]
+        if self._i2c_msg is not None:
+            msgs = [self._i2c_msg.write(self.addr, [reg, val]) for reg, val in writes]
+            self.bus.i2c_rdwr(*msgs)
+        else:
+            for reg, val in writes:
+                self.bus.write_byte_data(self.addr, reg, val)
+        
+        # Oscillator needs 500us after wake before restart
         time.sleep(0.005)
         
         # Auto-increment enabled
         self.bus.write_byte_data(self.addr, MODE1, old_mode | 0xA0)
-        print(f"PCA9685 initialized: prescale={prescale}, freq~{SERVO_FREQ}Hz")
+        print(f"PCA9685 initialized: prescale={PRESCALE_VAL}, freq~{SERVO_FREQ}Hz")
 
     def set_pwm(self, channel, on, off):
         """Set PWM for a channel."""
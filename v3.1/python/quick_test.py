@@ -1,46 +1,36 @@
 #!/usr/bin/env python3
 import websocket
-import time
+
+COMMANDS = [
+    ("Status", '{"type":"status"}'),
+    ("Servos", '{"type":"get_servos"}'),
+    ("Scan", '{"type":"scan","us":1200}'),
+    ("Move", '{"type":"move","t_ms":100,"us":[1500,1500,1500,1500,1500,1500,1500,1500,1500,1500,1500,1500,1500]}'),
+]
 
 ws = websocket.create_connection('ws://192.168.42.1:9000', timeout=5)
 print("Connected!")
+ws.settimeout(2.0)
 
-# Test status
-ws.send('{"type":"status"}')
-time.sleep(0.3)
-ws.settimeout(1)
-try:
-    r = ws.recv()
-    print(f"Status: {r}")
-except:
-    print("Status: no response")
+# The daemon greets each new client; read it so it isn't taken as the first reply
+print(f"Greeting: {ws.recv()}")
 
-# Test get_servos
-ws.send('{"type":"get_servos"}')
-time.sleep(0.3)
-try:
-    r = ws.recv()
-    print(f"Servos: {r}")
-except:
-    print("Servos: no response")
+# Send all commands back-to-back; the daemon answers each one in order
+for _, msg in COMMANDS:
+    ws.send(msg)
 
-# Test scan
-ws.send('{"type":"scan","us":1200}')
-time.sleep(0.3)
+responses = []
 try:
-    r = ws.recv()
-    print(f"Scan: {r}")
-except:
-    print("Scan: no response")
+    for _ in COMMANDS:
+        responses.append(ws.recv())
+except websocket.WebSocketTimeoutException:
+    pass
 
-# Test move
-ws.send('{"type":"move","t_ms":100,"us":[1500,1500,1500,1500,1500,1500,1500,1500,1500,1500,1500,1500,1500]}')
-time.sleep(0.3)
-try:
-    r = ws.recv()
-    print(f"Move: {r}")
-except:
-    print("Move: no response")
+for i, (name, _) in enumerate(COMMANDS):
+    if i < len(responses):
+        print(f"{name}: {responses[i]}")
+    else:
+        print(f"{name}: no response")
 
 ws.close()
 print("Done!")
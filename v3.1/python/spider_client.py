@@ -9,9 +9,16 @@ Protocol: JSON over WebSocket
 Default endpoint: ws://192.168.42.1:9000
 """
 
+import asyncio
+import itertools
 import json
+import random
+import select
+import struct
+import threading
 import time
-from typing import Optional, List, Dict, Any
+from collections import deque
+from typing import Optional, List, Dict, Any, Tuple
 
 try:
     import websocket
@@ -19,6 +26,25 @@ except ImportError:
     print("ERROR: websocket-client not installed. Run: pip install websocket-client")
     raise
 
+# Optional fast JSON codec (C/Rust); falls back to stdlib json
+try:
+    import orjson
+    _dumps = orjson.dumps  # Returns bytes, sent as-is in a text frame
+    _loads = orjson.loads
+except ImportError:
+    orjson = None
+    
+    def _dumps(obj) -> str:
+        # Compact like orjson: no spaces, so large frames (eye_path) fit the Brain's RX buffer
+        return json.dumps(obj, separators=(",", ":"))
+    _loads = json.loads
+
+
+# Binary move frame: magic (schema version), t_ms, servo_us[13], little-endian.
+# Must match WsBinaryMove in brain_linux/src/main.cpp.
+BINARY_MAGIC = 0xB31A
+_BINARY_MOVE = struct.Struct("<HI13H")
+
 
 class SpiderClient:
     """WebSocket client for Spider Robot v3.1 Brain daemon."""
@@ -31,6 +57,34 @@ class SpiderClient:
     SERVO_MAX_US = 2500
     SERVO_NEUTRAL_US = 1500
     
+    # Unread replies to fire-and-forget commands before draining
+    ACK_DRAIN_THRESHOLD = 16
+    
+    # How long to wait for a reply to a query
+    RESPONSE_TIMEOUT_S = 0.5
+    
+    # Max points per eye_path message (Brain RX buffer limit)
+    EYE_PATH_MAX_POINTS = 256
+    
+    # Largest client frame the Brain can take: RX_BUFFER_SIZE in main.cpp
+    # minus the 8-byte header (2 + 2-byte length + 4-byte mask)
+    BRAIN_MAX_PAYLOAD = 4096 - 8
+    
+    # Max (channel, us, dwell_ms) steps per servo_script message
+    SERVO_SCRIPT_MAX_STEPS = 128
+    
+    # Max fire-and-forget frames queued for the writer thread (pipelined mode)
+    SEND_QUEUE_MAX = 4
+    
+    # Connection keepalive / recovery
+    KEEPALIVE_INTERVAL_S = 10.0
+    RECONNECT_INTERVAL_S = 1.0  # Min time between reconnect attempts
+    
+    # Pre-built JSON for the hottest commands (skips dict + encoder)
+    _SERVO_TMPL = '{"type":"servo","channel":%d,"us":%d}'
+    _SERVOS_PREFIX = '{"type":"servos","us":['
+    _SERVOS_SUFFIX = ']}'
+    
     # Calibration offset limits (degrees)
     CALIB_OFFSET_MIN_DEG = -30
     CALIB_OFFSET_MAX_DEG = 30
@@ -54,6 +108,23 @@ class SpiderClient:
         self.ws: Optional[websocket.WebSocket] = None
         self.connected = False
         self.timeout = 5.0
+        self._pending_acks = 0  # Replies not yet read for fire-and-forget commands
+        self._distance_requests = 0  # request_distance() replies not yet read
+        self._last_distance_reply: Optional[str] = None
+        # Echoed "id" of queries; a random start keeps two clients' ids apart
+        self._reply_ids = itertools.count(random.randrange(1 << 24))
+        self.binary_frames = False  # Send move() as a binary frame instead of JSON
+        self.auto_reconnect = True  # Reconnect on dropped connection in send_command
+        self.pipelined = False  # Hand fire-and-forget sends to a writer thread
+        self._send_queue: deque = deque()  # [key, payload, opcode] entries
+        self._send_cv = threading.Condition()
+        self._writer: Optional[threading.Thread] = None
+        self._writer_running = False
+        self._writer_busy = False
+        self._want_connected = False
+        self._last_reconnect = 0.0
+        self._reconnect_lock = threading.Lock()  # Keepalive thread may reconnect too
+        self._keepalive_stop: Optional[threading.Event] = None
         self._calibration_offsets_us: List[int] = [0] * self.SERVO_COUNT_TOTAL
         self._apply_calibration = False
     
@@ -63,9 +134,16 @@ class SpiderClient:
             print(f"Connecting to {self.url}...")
             self.ws = websocket.create_connection(
                 self.url,
-                timeout=self.timeout
+                timeout=self.timeout,
+                enable_multithread=True,     # Keepalive thread sends pings
+                skip_utf8_validation=True,   # Replies are ASCII JSON
             )
             self.connected = True
+            self._want_connected = True
+            self._pending_acks = 0
+            self._distance_requests = 0
+            self._skip_greeting()
+            self._start_keepalive()
             print(f"Connected to Spider Brain at {self.url}")
             return True
         except ConnectionRefusedError:
@@ -78,8 +156,85 @@ class SpiderClient:
             print(f"ERROR: Failed to connect: {e}")
             return False
     
+    def _skip_greeting(self):
+        """
+        Read the Brain's {"status":"connected"} greeting.
+        
+        It is sent unprompted right after the handshake; left unread it would
+        be taken as the reply to the first query and every later reply would
+        be one frame behind.
+        """
+        deadline = time.monotonic() + self.RESPONSE_TIMEOUT_S
+        while self._wait_readable(max(0.0, deadline - time.monotonic())):
+            if self._recv_reply() is not None:
+                break
+    
+    async def connect_async(self) -> bool:
+        """
+        Connect without blocking the event loop.
+        
+        Runs connect() in the default executor so the TCP/WebSocket
+        handshake can overlap with other startup work.
+        """
+        loop = asyncio.get_running_loop()
+        return await loop.run_in_executor(None, self.connect)
+    
+    def _start_keepalive(self):
+        """Ping the Brain periodically so dead connections are noticed early."""
+        self._stop_keepalive()
+        stop = threading.Event()
+        ws = self.ws
+        
+        def run():
+            while not stop.wait(self.KEEPALIVE_INTERVAL_S):
+                try:
+                    ws.ping()
+                except Exception:
+                    if not stop.is_set() and self.ws is ws:
+                        # Dead link: don't leave it marked connected until the next send
+                        print("ERROR: Keepalive ping failed, connection lost")
+                        self.connected = False
+                        self._ensure_connected()
+                    break
+        
+        self._keepalive_stop = stop
+        threading.Thread(target=run, name="spider-keepalive", daemon=True).start()
+    
+    def _stop_keepalive(self):
+        if self._keepalive_stop is not None:
+            self._keepalive_stop.set()
+            self._keepalive_stop = None
+    
+    def _ensure_connected(self) -> bool:
+        """Reconnect after a dropped connection (rate limited)."""
+        if self.connected and self.ws:
+            return True
+        if not (self.auto_reconnect and self._want_connected):
+            return False
+        
+        with self._reconnect_lock:
+            if self.connected and self.ws:
+                return True  # Reconnected by another thread meanwhile
+            
+            now = time.monotonic()
+            if now - self._last_reconnect < self.RECONNECT_INTERVAL_S:
+                return False
+            self._last_reconnect = now
+            
+            if self.ws:
+                try:
+                    self.ws.close()
+                except Exception:
+                    pass
+                self.ws = None
+            return self.connect()
+    
     def disconnect(self):
         """Disconnect from the Brain daemon."""
+        self._flush_sends()
+        self._stop_writer()
+        self._want_connected = False
+        self._stop_keepalive()
         if self.ws:
             try:
                 self.ws.close()
@@ -89,34 +244,228 @@ class SpiderClient:
         self.connected = False
         print("Disconnected from Spider Brain")
     
-    def send_command(self, command: Dict[str, Any]) -> Optional[Dict[str, Any]]:
-        """Send a JSON command and return the response (if any)."""
-        if not self.connected or not self.ws:
+    def send_command(self, command: Dict[str, Any],
+                     expect_response: bool = False,
+                     response_timeout: Optional[float] = None) -> Optional[Dict[str, Any]]:
+        """
+        Send a JSON command.
+        
+        Args:
+            command: Command dict
+            expect_response: If True, wait for and return the reply. Otherwise
+                return immediately after sending (the Brain's ack is
+                discarded later).
+            response_timeout: Reply wait in seconds (default RESPONSE_TIMEOUT_S)
+        """
+        reply_id = None
+        if expect_response:
+            reply_id = next(self._reply_ids)
+            command = dict(command, id=reply_id)
+        return self._send(_dumps(command), websocket.ABNF.OPCODE_TEXT, expect_response,
+                          response_timeout=response_timeout, reply_id=reply_id)
+    
+    def send_binary(self, payload: bytes,
+                    expect_response: bool = False) -> Optional[Dict[str, Any]]:
+        """Send a binary command frame (see move()); replies are JSON."""
+        return self._send(payload, websocket.ABNF.OPCODE_BINARY, expect_response)
+    
+    def _send(self, payload, opcode: int, expect_response: bool,
+              retry: bool = True, key: Any = None,
+              response_timeout: Optional[float] = None,
+              reply_id: Optional[int] = None) -> Optional[Dict[str, Any]]:
+        """
+        Send one frame and optionally wait for the JSON reply.
+        
+        With reply_id set (the command's "id"), the reply is the frame the
+        Brain tags with the same id; other frames (acks, other clients'
+        replies, broadcasts) are skipped. Without it the next reply after
+        the pending acks is taken.
+        
+        In pipelined mode fire-and-forget frames are queued for the writer
+        thread; a queued frame with the same key is replaced by the newer one.
+        """
+        if not self._ensure_connected():
             print("ERROR: Not connected to Brain daemon")
             return None
         
         try:
-            msg = json.dumps(command)
-            self.ws.send(msg)
+            if expect_response:
+                # Skip acks of earlier commands so we read our own reply;
+                # a tagged reply is found by id, so only take what's waiting
+                self._flush_sends()
+                self._drain_acks(block=reply_id is None)
+            elif self._pending_acks >= self.ACK_DRAIN_THRESHOLD:
+                self._drain_acks(block=False)
             
-            # Try to receive response (non-blocking with short timeout)
-            self.ws.settimeout(0.5)
-            try:
-                response = self.ws.recv()
-                return json.loads(response) if response else None
-            except websocket.WebSocketTimeoutException:
-                return None  # No response expected for some commands
-            finally:
-                self.ws.settimeout(self.timeout)
+            if self.pipelined and not expect_response:
+                if self._enqueue(key, payload, opcode):
+                    self._pending_acks += 1
+                return None
+            
+            self._flush_sends()  # Frames still queued from pipelined mode go first
+            self.ws.send(payload, opcode)
+            
+            if not expect_response:
+                self._pending_acks += 1
+                return None
+            
+            # Wait for the reply with select; the socket keeps the timeout
+            # set at connect, so no setsockopt per command
+            if response_timeout is None:
+                response_timeout = self.RESPONSE_TIMEOUT_S
+            deadline = time.monotonic() + response_timeout
+            tag = None if reply_id is None else '{"id":%d,' % reply_id
+            while True:
+                if not self._wait_readable(max(0.0, deadline - time.monotonic())):
+                    return None
+                response = self._recv_reply()
+                if response is None:
+                    continue
+                if tag is None or response.startswith(tag):
+                    return _loads(response) if response else None
+                self._count_ack(response)
                 
-        except websocket.WebSocketConnectionClosedException:
+        except (websocket.WebSocketConnectionClosedException, ConnectionError):
             print("ERROR: Connection closed by server")
             self.connected = False
+            self._stop_keepalive()
+            if retry and self._ensure_connected():
+                return self._send(payload, opcode, expect_response, retry=False,
+                                  key=key, response_timeout=response_timeout,
+                                  reply_id=reply_id)
             return None
         except Exception as e:
             print(f"ERROR: Failed to send command: {e}")
             return None
     
+    def _enqueue(self, key: Any, payload, opcode: int) -> bool:
+        """
+        Queue a frame for the writer thread, blocking while the queue is full.
+        
+        Returns False if the frame replaced a queued frame with the same key
+        (no extra reply is expected in that case).
+        """
+        with self._send_cv:
+            queue = self._send_queue
+            replaced = False
+            if key is not None:
+                for entry in queue:
+                    if entry[0] == key:
+                        # Keep ordering: the newer frame goes to the back
+                        queue.remove(entry)
+                        replaced = True
+                        break
+            while len(queue) >= self.SEND_QUEUE_MAX:
+                self._send_cv.wait()
+            queue.append([key, payload, opcode])
+            if not self._writer_running:
+                self._writer_running = True
+                self._writer = threading.Thread(target=self._writer_loop,
+                                                name="spider-writer", daemon=True)
+                self._writer.start()
+            self._send_cv.notify_all()
+            return not replaced
+    
+    def _writer_loop(self):
+        """Send queued frames while the caller prepares the next one."""
+        queue, cv = self._send_queue, self._send_cv
+        while True:
+            with cv:
+                while not queue:
+                    if not self._writer_running:
+                        return
+                    cv.wait()
+                _, payload, opcode = queue.popleft()
+                self._writer_busy = True
+                cv.notify_all()
+            try:
+                self.ws.send(payload, opcode)
+            except Exception as e:
+                print(f"ERROR: Failed to send command: {e}")
+                self.connected = False
+                with cv:
+                    queue.clear()  # Stale motion frames; reconnect starts fresh
+            finally:
+                with cv:
+                    self._writer_busy = False
+                    cv.notify_all()
+    
+    def _flush_sends(self):
+        """Wait until the writer thread has sent every queued frame."""
+        with self._send_cv:
+            while self._send_queue or self._writer_busy:
+                self._send_cv.wait()
+    
+    def _stop_writer(self):
+        with self._send_cv:
+            self._writer_running = False
+            self._send_cv.notify_all()
+        if self._writer is not None:
+            self._writer.join(timeout=1.0)
+            self._writer = None
+    
+    def _drain_acks(self, block: bool):
+        """
+        Read and discard replies to fire-and-forget commands.
+        
+        With block=False only replies already waiting on the socket are
+        consumed, so the receive buffer never fills up during streaming.
+        """
+        if not self._pending_acks:
+            return
+        
+        wait = self.RESPONSE_TIMEOUT_S if block else 0
+        while self._pending_acks > 0:
+            if not self._wait_readable(wait):
+                if block:
+                    self._pending_acks = 0  # Some commands were not acked
+                    self._distance_requests = 0
+                break
+            try:
+                self._read_ack()
+            except websocket.WebSocketTimeoutException:
+                break  # Partial frame; finish it on the next drain
+    
+    def _read_ack(self) -> bool:
+        """
+        Read one fire-and-forget reply, keeping it if it answers request_distance().
+        
+        Returns False if the frame was a control frame (no reply consumed).
+        """
+        response = self._recv_reply()
+        if response is None:
+            return False
+        self._count_ack(response)
+        return True
+    
+    def _count_ack(self, response: str):
+        """Account for a reply that isn't the one being waited for."""
+        # Other clients' replies are broadcast too, so never go below zero
+        if self._pending_acks > 0:
+            self._pending_acks -= 1
+        if self._distance_requests and '"type":"distance"' in response:
+            self._distance_requests -= 1
+            self._last_distance_reply = response
+    
+    def _recv_reply(self):
+        """
+        Read one frame; returns None for ping/pong control frames.
+        
+        ws.recv() would swallow a pong (answering the keepalive ping) and
+        block for the next data frame although select() reported the
+        socket readable.
+        """
+        opcode, data = self.ws.recv_data(control_frame=True)
+        if opcode in (websocket.ABNF.OPCODE_TEXT, websocket.ABNF.OPCODE_BINARY):
+            return data.decode() if isinstance(data, bytes) else data
+        if opcode == websocket.ABNF.OPCODE_CLOSE:
+            raise websocket.WebSocketConnectionClosedException("Connection closed by server")
+        return None
+    
+    def _wait_readable(self, timeout: float) -> bool:
+        """Return True if a frame is waiting on the socket within timeout."""
+        return bool(select.select([self.ws.sock], [], [], timeout)[0])
+    
     # ===== Calibration Methods =====
     
     def set_calibration(self, offsets: List[int]) -> None:
@@ -162,7 +511,9 @@ class SpiderClient:
     
     def _apply_calib_offset(self, channel: int, us: int, apply_calibration: bool = True) -> int:
         """Apply calibration offset to a PWM value if enabled."""
-        if apply_calibration and self._apply_calibration and 0 <= channel < len(self._calibration_offsets_us):
+        if not (apply_calibration and self._apply_calibration):
+            return max(self.SERVO_MIN_US, min(self.SERVO_MAX_US, us))
+        if 0 <= channel < self.SERVO_COUNT_TOTAL:
             us += self._calibration_offsets_us[channel]
         return max(self.SERVO_MIN_US, min(self.SERVO_MAX_US, us))
     
@@ -183,8 +534,8 @@ class SpiderClient:
         
         us = self._apply_calib_offset(channel, us, apply_calibration)
         
-        command = {"type": "servo", "channel": channel, "us": us}
-        self.send_command(command)
+        msg = self._SERVO_TMPL % (channel, us)
+        self._send(msg, websocket.ABNF.OPCODE_TEXT, False, key=("servo", channel))
         return True
     
     def set_all_servos(self, us_values: List[int], apply_calibration: bool = True) -> bool:
@@ -199,15 +550,116 @@ class SpiderClient:
             print(f"ERROR: Expected {self.SERVO_COUNT} values, got {len(us_values)}")
             return False
         
+        # Inline offset + clamp (one comprehension, no per-channel method call)
+        lo, hi = self.SERVO_MIN_US, self.SERVO_MAX_US
+        if apply_calibration and self._apply_calibration:
+            calibrated_values = [
+                max(lo, min(hi, us + offset))
+                for us, offset in zip(us_values, self._calibration_offsets_us)
+            ]
+        else:
+            calibrated_values = [max(lo, min(hi, us)) for us in us_values]
+        
+        msg = self._SERVOS_PREFIX + ",".join(map(str, calibrated_values)) + self._SERVOS_SUFFIX
+        self._send(msg, websocket.ABNF.OPCODE_TEXT, False, key="servos")
+        return True
+    
+    def set_servos_sparse(self, channels: List[int], us_values: List[int],
+                          apply_calibration: bool = True) -> bool:
+        """
+        Set a subset of servos in a single message.
+        
+        Sends {"type":"servos_partial","channels":[...],"us":[...]};
+        servos not listed keep their current position.
+        
+        Args:
+            channels: Servo channels (0-11 for legs)
+            us_values: Pulse widths, one per channel
+            apply_calibration: If True and calibration is set, apply offsets
+        """
+        if len(channels) != len(us_values):
+            print(f"ERROR: Got {len(channels)} channels but {len(us_values)} values")
+            return False
+        
+        for channel in channels:
+            if not 0 <= channel < self.SERVO_COUNT:
+                print(f"ERROR: Invalid channel {channel}. Must be 0-{self.SERVO_COUNT-1}")
+                return False
+        
         calibrated_values = [
             self._apply_calib_offset(ch, us, apply_calibration)
-            for ch, us in enumerate(us_values)
+            for ch, us in zip(channels, us_values)
         ]
         
-        command = {"type": "servos", "us": calibrated_values}
+        command = {"type": "servos_partial", "channels": list(channels), "us": calibrated_values}
         self.send_command(command)
         return True
     
+    def move(self, us_values: List[int], t_ms: int = 0,
+             apply_calibration: bool = True) -> bool:
+        """
+        Move all servos (including scan) to a pose over t_ms milliseconds.
+        
+        Sent as a 32-byte binary frame when binary_frames is enabled,
+        otherwise as a JSON "move" command.
+        
+        Args:
+            us_values: List of pulse widths (must have SERVO_COUNT_TOTAL values)
+            t_ms: Interpolation time to reach the pose
+            apply_calibration: If True and calibration is set, apply offsets
+        """
+        if len(us_values) != self.SERVO_COUNT_TOTAL:
+            print(f"ERROR: Expected {self.SERVO_COUNT_TOTAL} values, got {len(us_values)}")
+            return False
+        
+        lo, hi = self.SERVO_MIN_US, self.SERVO_MAX_US
+        if apply_calibration and self._apply_calibration:
+            calibrated_values = [
+                max(lo, min(hi, us + offset))
+                for us, offset in zip(us_values, self._calibration_offsets_us)
+            ]
+        else:
+            calibrated_values = [max(lo, min(hi, us)) for us in us_values]
+        
+        if self.binary_frames:
+            self.send_binary(_BINARY_MOVE.pack(BINARY_MAGIC, t_ms, *calibrated_values))
+        else:
+            command = {"type": "move", "t_ms": t_ms, "us": calibrated_values}
+            self.send_command(command)
+        return True
+    
+    def servo_script(self, steps: List[Tuple[int, int, int]],
+                     apply_calibration: bool = True) -> Optional[int]:
+        """
+        Queue a timed servo sequence for playback on the Brain.
+        
+        Each (channel, us, dwell_ms) step sets one servo and then waits
+        dwell_ms before the next step. Timing is kept by the Brain, so the
+        whole sequence costs one round-trip.
+        
+        Returns:
+            Total script duration in ms, or None if the Brain rejected it
+            (e.g. an older daemon without servo_script).
+        """
+        if not steps or len(steps) > self.SERVO_SCRIPT_MAX_STEPS:
+            print(f"ERROR: servo_script needs 1-{self.SERVO_SCRIPT_MAX_STEPS} steps, got {len(steps)}")
+            return None
+        
+        flat = []
+        for channel, us, dwell_ms in steps:
+            if not 0 <= channel < self.SERVO_COUNT_TOTAL:
+                print(f"ERROR: Invalid channel {channel}. Must be 0-{self.SERVO_COUNT_TOTAL-1}")
+                return None
+            flat.append(channel)
+            flat.append(self._apply_calib_offset(channel, us, apply_calibration))
+            flat.append(max(0, int(dwell_ms)))
+        
+        command = {"type": "servo_script", "steps": flat}
+        response = self.send_command(command, expect_response=True)
+        if response and response.get("status") == "ok":
+            return response.get("duration_ms", 0)
+        return None
+    
     def set_leg(self, leg: int, coxa_us: int, femur_us: int, tibia_us: int, 
                 apply_calibration: bool = True) -> bool:
         """Set all three servos of a leg at once."""
@@ -215,11 +667,9 @@ class SpiderClient:
             print(f"ERROR: Invalid leg {leg}. Must be 0-3")
             return False
         
-        channels = self.LEG_CHANNELS[leg]
-        self.set_servo(channels[0], coxa_us, apply_calibration)
-        self.set_servo(channels[1], femur_us, apply_calibration)
-        self.set_servo(channels[2], tibia_us, apply_calibration)
-        return True
+        return self.set_servos_sparse(self.LEG_CHANNELS[leg],
+                                      [coxa_us, femur_us, tibia_us],
+                                      apply_calibration)
     
     def all_neutral(self, apply_calibration: bool = True) -> bool:
         """Set all servos to neutral position (1500us)."""
@@ -229,6 +679,11 @@ class SpiderClient:
     def estop(self) -> bool:
         """Emergency stop - disable all servos immediately."""
         print("!!! E-STOP ACTIVATED !!!")
+        with self._send_cv:
+            # Never move after an E-STOP; dropped frames won't be acked
+            self._pending_acks -= len(self._send_queue)
+            self._send_queue.clear()
+            self._send_cv.notify_all()
         command = {"type": "estop"}
         self.send_command(command)
         return True
@@ -236,7 +691,7 @@ class SpiderClient:
     def get_status(self) -> Optional[Dict[str, Any]]:
         """Query Brain daemon status."""
         command = {"type": "status"}
-        return self.send_command(command)
+        return self.send_command(command, expect_response=True)
     
     # ===== Eye Control Methods =====
     
@@ -245,9 +700,41 @@ class SpiderClient:
         x = max(-1.0, min(1.0, x))
         y = max(-1.0, min(1.0, y))
         command = {"type": "look", "x": x, "y": y}
-        self.send_command(command)
+        # Keyed so a queued look is replaced by a newer one in pipelined mode
+        self._send(_dumps(command), websocket.ABNF.OPCODE_TEXT, False, key="look")
         return True
     
+    def eye_path(self, points: List[Tuple[float, float]], dt: float = 0.033) -> bool:
+        """
+        Send a whole eye trajectory; the Brain plays it back every dt seconds.
+        
+        Args:
+            points: (x, y) pupil positions in range [-1.0, 1.0]
+            dt: Time between points in seconds
+        
+        Returns:
+            True if the Brain accepted the path (False on older daemons
+            without eye_path support, so callers can fall back to eye_look).
+        """
+        if not points or len(points) > self.EYE_PATH_MAX_POINTS:
+            print(f"ERROR: eye_path needs 1-{self.EYE_PATH_MAX_POINTS} points, got {len(points)}")
+            return False
+        
+        xy = []
+        for x, y in points:
+            xy.append(round(max(-1.0, min(1.0, x)), 3))
+            xy.append(round(max(-1.0, min(1.0, y)), 3))
+        reply_id = next(self._reply_ids)
+        command = {"type": "eye_path", "dt_ms": max(1, int(round(dt * 1000))), "xy": xy,
+                   "id": reply_id}
+        payload = _dumps(command)
+        if len(payload) > self.BRAIN_MAX_PAYLOAD:
+            # An oversized frame fills the Brain's RX buffer and it drops us
+            print(f"ERROR: eye_path message is {len(payload)} bytes, max {self.BRAIN_MAX_PAYLOAD}")
+            return False
+        response = self._send(payload, websocket.ABNF.OPCODE_TEXT, True, reply_id=reply_id)
+        return bool(response) and response.get("status") == "ok"
+    
     def eye_blink(self) -> bool:
         """Trigger a blink animation on both eyes."""
         command = {"type": "blink"}
@@ -286,11 +773,100 @@ class SpiderClient:
             Distance in millimeters, or None on error.
         """
         command = {"type": "distance"}
-        response = self.send_command(command)
+        response = self.send_command(command, expect_response=True)
         if response and response.get("status") == "ok":
             return response.get("distance_mm")
         return None
     
+    def request_distance(self) -> bool:
+        """
+        Send a distance query without waiting for the reply.
+        
+        Lets the round trip overlap other work (e.g. the next scan_angle());
+        collect the result with read_distance().
+        """
+        self.send_command({"type": "distance"})
+        if not self.connected:
+            return False
+        self._distance_requests += 1
+        return True
+    
+    def read_distance(self, timeout: Optional[float] = None) -> Optional[int]:
+        """
+        Collect the reply to the last request_distance().
+        
+        Returns at once if the reply has already arrived, otherwise waits up
+        to timeout (default RESPONSE_TIMEOUT_S).
+        
+        Returns:
+            Distance in millimeters, or None on error.
+        """
+        if timeout is None:
+            timeout = self.RESPONSE_TIMEOUT_S
+        try:
+            if self._distance_requests:
+                self._flush_sends()
+            while self._distance_requests:
+                if not self._wait_readable(timeout):
+                    self._distance_requests = 0  # A late reply is drained as an ack
+                    break
+                self._read_ack()
+        except (websocket.WebSocketConnectionClosedException, ConnectionError):
+            print("ERROR: Connection closed by server")
+            self.connected = False
+            self._distance_requests = 0
+        
+        reply, self._last_distance_reply = self._last_distance_reply, None
+        if reply:
+            response = _loads(reply)
+            if response.get("status") == "ok":
+                return response.get("distance_mm")
+        return None
+    
+    def get_distance_batch(self, n: int = 10,
+                           interval_ms: int = 100) -> Optional[List[Optional[int]]]:
+        """
+        Take n VL53L0X readings on the Brain, interval_ms apart, in one request.
+        
+        Returns:
+            List of distances in mm (None for failed readings), or None if
+            the Brain rejected the request (e.g. older daemon, sensor busy).
+        """
+        command = {"type": "distance_batch", "n": n, "interval_ms": interval_ms}
+        # Each reading waits interval_ms plus one ranging cycle on the Brain
+        timeout = n * (interval_ms + 50) / 1000.0 + 1.0
+        response = self.send_command(command, expect_response=True, response_timeout=timeout)
+        if response and response.get("status") == "ok":
+            return response.get("readings", [])
+        return None
+    
+    def start_distance_measurement(self) -> bool:
+        """
+        Start a VL53L0X measurement without waiting for the result.
+        
+        Returns:
+            True if ranging was started; poll with poll_distance().
+        """
+        command = {"type": "distance_start"}
+        response = self.send_command(command, expect_response=True)
+        return bool(response) and response.get("status") == "ok"
+    
+    def poll_distance(self) -> Tuple[bool, Optional[int]]:
+        """
+        Poll the measurement started by start_distance_measurement().
+        
+        Returns:
+            Tuple of (done, distance_mm). done is False while ranging is
+            still in progress; distance_mm is None on error.
+        """
+        command = {"type": "distance_poll"}
+        response = self.send_command(command, expect_response=True)
+        if response and response.get("status") == "busy":
+            return (False, None)
+        if response and response.get("status") == "ok":
+            return (True, response.get("distance_mm"))
+        return (True, None)
+    
     def is_obstacle_close(self, threshold_mm: int = 150) -> bool:
         """Check if an obstacle is within the given threshold."""
         distance = self.get_distance()
@@ -353,13 +929,46 @@ class SpiderClient:
         
         for i in range(steps):
             angle = min_angle + i * step_size
+            # Servo travel wait runs from just before the move is sent, so
+            # the send time counts toward delay_s (the reading doesn't)
+            deadline = time.monotonic() + delay_s
             self.scan_angle(angle, apply_calibration)
-            time.sleep(delay_s)
+            slack = deadline - time.monotonic()
+            if slack > 0:
+                time.sleep(slack)
             distance = self.get_distance()
             readings.append(distance)
         
         return readings
     
+    def sweep_server(self, min_angle: int = 0, max_angle: int = 180,
+                     steps: int = 9, delay_ms: int = 150,
+                     apply_calibration: bool = True) -> List[Optional[int]]:
+        """
+        Perform a scan sweep on the Brain in a single request.
+        
+        Sends {"type":"sweep","min":..,"max":..,"steps":..,"delay_ms":..}.
+        The Brain steps the scan servo from min to max, waits delay_ms at
+        each point, reads the VL53L0X locally and replies once with
+        {"type":"sweep","status":"ok","readings":[...]} (null = failed
+        reading). Replaces 2*steps round-trips of scan_sweep().
+        
+        Returns:
+            List of distance readings (mm), None for failed readings.
+            Empty list if the sweep was rejected or timed out.
+        """
+        command = {"type": "sweep", "min": int(min_angle), "max": int(max_angle),
+                   "steps": steps, "delay_ms": delay_ms}
+        if apply_calibration and self._apply_calibration:
+            command["offset_us"] = self._calibration_offsets_us[self.SERVO_CHANNEL_SCAN]
+        
+        # Each step waits delay_ms plus one ranging cycle on the Brain
+        timeout = steps * (delay_ms + 50) / 1000.0 + 1.0
+        response = self.send_command(command, expect_response=True, response_timeout=timeout)
+        if response and response.get("status") == "ok":
+            return response.get("readings", [])
+        return []
+    
     def __enter__(self):
         """Context manager entry."""
         self.connect()
@@ -386,7 +995,11 @@ def main():
         print("\n--- Testing status query ---")
         status = client.get_status()
         if status:
-            print(f"Status: {json.dumps(status, indent=2)}")
+            if orjson is not None:
+                status_str = orjson.dumps(status, option=orjson.OPT_INDENT_2).decode()
+            else:
+                status_str = json.dumps(status, indent=2)
+            print(f"Status: {status_str}")
         else:
             print("No status response (may be normal)")
         
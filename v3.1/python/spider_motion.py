@@ -7,16 +7,25 @@ Run directly on Milk-V Duo for hardware-level gait testing.
 
 import time
 import math
+from array import array
 
 # PCA9685 Configuration
 PCA9685_ADDR = 0x40
 MODE1 = 0x00
 PRESCALE = 0xFE
 LED0_ON_L = 0x06
+I2C_BLOCK_MAX = 32  # SMBus block write limit (bytes)
+FRAME_PERIOD_S = 0.02  # 50 Hz pose interpolation
 SERVO_FREQ = 50
 SERVO_MIN_US = 500
 SERVO_MAX_US = 2500
 
+# Angle (0-180°) -> 12-bit PCA9685 off count at SERVO_FREQ
+ANGLE_TO_OFF = tuple(
+    int((SERVO_MIN_US + (SERVO_MAX_US - SERVO_MIN_US) * a / 180) * 4096 / 20000)
+    for a in range(181)
+)
+
 # Leg servo mapping: leg_name -> {joint: channel}
 # Based on PINOUT.md
 LEGS = {
@@ -26,6 +35,15 @@ LEGS = {
     "LF": {"coxa": 9, "femur": 10, "tibia": 11},
 }
 
+# Flat channel layout: index -> (leg_name, joint_name, channel)
+CHANNELS = tuple((leg, joint, LEGS[leg][joint]) for leg in LEGS for joint in ("coxa", "femur", "tibia"))
+
+
+def pose_to_array(pose):
+    """Flatten a full {leg: {joint: angle}} pose into CHANNELS order."""
+    return array('h', [pose[leg][joint] for leg, joint, _ in CHANNELS])
+
+
 # Neutral pose (all at 90°)
 POSE_NEUTRAL = {leg: {"coxa": 90, "femur": 90, "tibia": 90} for leg in LEGS}
 
@@ -45,6 +63,11 @@ POSE_SIT = {
     "LF": {"coxa": 120, "femur": 120, "tibia": 60},
 }
 
+# Pre-flattened poses for set_pose
+POSE_NEUTRAL_ARR = pose_to_array(POSE_NEUTRAL)
+POSE_STAND_ARR = pose_to_array(POSE_STAND)
+POSE_SIT_ARR = pose_to_array(POSE_SIT)
+
 class PCA9685:
     def __init__(self, bus_num=1, addr=PCA9685_ADDR):
         self.addr = addr
@@ -53,6 +76,8 @@ class PCA9685:
         except ImportError:
             import smbus
         self.bus = smbus.SMBus(bus_num)
+        # Mirror of LED0_ON_L..LED15_OFF_H for auto-increment burst writes
+        self._buf = bytearray(64)
         self._init()
 
     def _init(self):
@@ -66,60 +91,126 @@ class PCA9685:
         time.sleep(0.005)
         self.bus.write_byte_data(self.addr, MODE1, old_mode | 0xA0)
 
+    def _store(self, ch, on, off):
+        i = 4 * ch
+        self._buf[i:i + 4] = bytes((on & 0xFF, on >> 8, off & 0xFF, off >> 8))
+
+    def _write_burst(self, first_ch, end_ch):
+        """Write mirrored registers for channels [first_ch, end_ch) using auto-increment."""
+        start, end = 4 * first_ch, 4 * end_ch
+        for pos in range(start, end, I2C_BLOCK_MAX):
+            chunk = self._buf[pos:min(pos + I2C_BLOCK_MAX, end)]
+            self.bus.write_i2c_block_data(self.addr, LED0_ON_L + pos, list(chunk))
+
     def set_pwm(self, ch, on, off):
-        reg = LED0_ON_L + 4 * ch
-        self.bus.write_i2c_block_data(self.addr, reg, [on & 0xFF, on >> 8, off & 0xFF, off >> 8])
+        self._store(ch, on, off)
+        self._write_burst(ch, ch + 1)
+
+    def set_all_pwm(self, off_values):
+        """Set channels 0..len(off_values)-1 (on=0) in one burst."""
+        for ch, off in enumerate(off_values):
+            self._store(ch, 0, off)
+        self._write_burst(0, len(off_values))
+
+    @staticmethod
+    def _angle_to_off(angle):
+        return ANGLE_TO_OFF[max(0, min(180, int(angle)))]
 
     def set_angle(self, ch, angle):
-        angle = max(0, min(180, angle))
-        pulse_us = SERVO_MIN_US + (SERVO_MAX_US - SERVO_MIN_US) * angle / 180
-        off_val = int(pulse_us * 4096 / 20000)
-        self.set_pwm(ch, 0, off_val)
+        self.set_pwm(ch, 0, self._angle_to_off(angle))
+
+    def set_angles(self, ch_angles):
+        """Set several (channel, angle) pairs, one burst per run of adjacent channels."""
+        channels = set()
+        for ch, angle in ch_angles:
+            self._store(ch, 0, self._angle_to_off(angle))
+            channels.add(ch)
+        if not channels:
+            return
+        # Never burst across a gap: the mirror holds zeros for channels never
+        # commanded, and writing them would cut those servos' pulses
+        channels = sorted(channels)
+        run_start = prev = channels[0]
+        for ch in channels[1:]:
+            if ch != prev + 1:
+                self._write_burst(run_start, prev + 1)
+                run_start = ch
+            prev = ch
+        self._write_burst(run_start, prev + 1)
 
     def disable_all(self):
-        for ch in range(16):
-            self.set_pwm(ch, 0, 0)
+        self.set_all_pwm([0] * 16)
 
 
 class SpiderMotion:
     def __init__(self):
         self.pca = PCA9685()
-        self.current_pose = {leg: dict(joints) for leg, joints in POSE_NEUTRAL.items()}
+        # Current angle per CHANNELS index
+        self.current_angles = list(POSE_NEUTRAL_ARR)
         print("SpiderMotion initialized")
 
+    @property
+    def current_pose(self):
+        """Current pose as {leg: {joint: angle}}."""
+        pose = {leg: {} for leg in LEGS}
+        for (leg, joint, _), angle in zip(CHANNELS, self.current_angles):
+            pose[leg][joint] = angle
+        return pose
+
     def set_pose(self, pose, duration_s=0.5):
-        """Smoothly transition to a target pose."""
+        """Smoothly transition to a target pose.
+
+        pose is either a flat sequence of angles in CHANNELS order or a
+        (possibly partial) {leg: {joint: angle}} dict.
+        """
         steps = int(duration_s * 50)
         if steps < 1:
             steps = 1
 
-        for step in range(steps + 1):
-            t = step / steps
-            for leg_name, joints in pose.items():
-                if leg_name not in LEGS:
-                    continue
-                for joint_name, target_angle in joints.items():
-                    if joint_name not in LEGS[leg_name]:
-                        continue
-                    ch = LEGS[leg_name][joint_name]
-                    start = self.current_pose.get(leg_name, {}).get(joint_name, 90)
-                    angle = int(start + (target_angle - start) * t)
-                    self.pca.set_angle(ch, angle)
-            time.sleep(0.02)
-
-        self.current_pose = {leg: dict(joints) for leg, joints in pose.items()}
+        if isinstance(pose, dict):
+            targets = [pose.get(leg_name, {}).get(joint_name) for leg_name, joint_name, _ in CHANNELS]
+        else:
+            targets = pose
+
+        # (index, channel, start, delta) per joint that has a target
+        current = self.current_angles
+        moves = [
+            (i, ch, current[i], target - current[i])
+            for i, ((_, _, ch), target) in enumerate(zip(CHANNELS, targets))
+            if target is not None
+        ]
+
+        # Interpolate every frame up front so the paced loop only does I/O
+        frames = [
+            [(ch, start + delta * step // steps) for _, ch, start, delta in moves]
+            for step in range(steps + 1)
+        ]
+
+        set_angles = self.pca.set_angles
+        deadline = time.monotonic()
+        for frame in frames:
+            # One I2C burst per frame instead of one write per channel
+            set_angles(frame)
+            # Pace on absolute deadlines so write time doesn't stretch the period
+            deadline += FRAME_PERIOD_S
+            slack = deadline - time.monotonic()
+            if slack > 0:
+                time.sleep(slack)
+
+        for i, _, start, delta in moves:
+            current[i] = start + delta
 
     def stand(self):
         print("Standing...")
-        self.set_pose(POSE_STAND, 1.0)
+        self.set_pose(POSE_STAND_ARR, 1.0)
 
     def sit(self):
         print("Sitting...")
-        self.set_pose(POSE_SIT, 1.0)
+        self.set_pose(POSE_SIT_ARR, 1.0)
 
     def neutral(self):
         print("Neutral position...")
-        self.set_pose(POSE_NEUTRAL, 1.0)
+        self.set_pose(POSE_NEUTRAL_ARR, 1.0)
 
     def wave(self, leg="RF"):
         """Wave with front right leg."""
@@ -127,20 +218,20 @@ class SpiderMotion:
         if leg not in LEGS:
             return
 
+        # Only the waving leg moves; other legs hold their current angles
+        scratch = {leg: {"coxa": 45, "femur": 30, "tibia": 90}}
+
         # Lift leg
-        wave_up = dict(self.current_pose)
-        wave_up[leg] = {"coxa": 45, "femur": 30, "tibia": 90}
-        self.set_pose(wave_up, 0.5)
+        self.set_pose(scratch, 0.5)
 
         # Wave motion
+        joints = scratch[leg]
         for _ in range(3):
-            wave_left = dict(wave_up)
-            wave_left[leg] = {"coxa": 30, "femur": 30, "tibia": 90}
-            self.set_pose(wave_left, 0.2)
+            joints["coxa"] = 30
+            self.set_pose(scratch, 0.2)
 
-            wave_right = dict(wave_up)
-            wave_right[leg] = {"coxa": 60, "femur": 30, "tibia": 90}
-            self.set_pose(wave_right, 0.2)
+            joints["coxa"] = 60
+            self.set_pose(scratch, 0.2)
 
         # Return to stand
         self.stand()
@@ -4,27 +4,50 @@ Spider Robot v3.1 - Simulation Mode
 Runs without hardware - prints what WOULD happen.
 """
 
+import os
+import sys
 import time
 import json
+import random
 
 LEGS = ["RF", "RM", "RH", "LF", "LM", "LH"]
 JOINTS = ["coxa", "femur", "tibia"]
 
+# Per-joint servo output is only printed with SPIDER_SIM_VERBOSE=1
+SIM_VERBOSE = os.getenv("SPIDER_SIM_VERBOSE", "0") == "1"
+
 class SimServo:
-    def __init__(self):
+    def __init__(self, verbose=SIM_VERBOSE):
         self.angles = {leg: {j: 90 for j in JOINTS} for leg in LEGS}
+        self.verbose = verbose
     
     def set_angle(self, leg, joint, angle):
         self.angles[leg][joint] = angle
-        print(f"  [SIM] {leg}.{joint} -> {angle}°")
+        if self.verbose:
+            print(f"  [SIM] {leg}.{joint} -> {angle}°")
+    
+    def set_angles(self, angles_dict):
+        """Set a whole pose; verbose output is written in one call."""
+        lines = []
+        for leg, joints in angles_dict.items():
+            for joint, angle in joints.items():
+                self.angles[leg][joint] = angle
+                if self.verbose:
+                    lines.append(f"  [SIM] {leg}.{joint} -> {angle}°\n")
+        if lines:
+            sys.stdout.write("".join(lines))
 
 class SimLidar:
+    SAMPLE_POOL = 256
+    
     def __init__(self):
         self.distance = 500
+        self._samples = [random.randint(100, 2000) for _ in range(self.SAMPLE_POOL)]
+        self._idx = 0
     
     def read(self):
-        import random
-        self.distance = random.randint(100, 2000)
+        self.distance = self._samples[self._idx]
+        self._idx = (self._idx + 1) % self.SAMPLE_POOL
         return self.distance
 
 class SpiderSim:
@@ -36,9 +59,7 @@ class SpiderSim:
     
     def pose(self, name, angles_dict):
         print(f"\n[POSE] {name}")
-        for leg, joints in angles_dict.items():
-            for joint, angle in joints.items():
-                self.servos.set_angle(leg, joint, angle)
+        self.servos.set_angles(angles_dict)
         time.sleep(0.3)
     
     def stand(self):
@@ -0,0 +1,34 @@
+#!/usr/bin/env python3
+"""
+Spider Robot v3.1 - Shared Test Script Helpers
+
+Command-line setup shared by the interactive and automated test scripts.
+"""
+
+import argparse
+from typing import Optional
+
+
+def build_client_argparser(description: str, epilog: Optional[str] = None) -> argparse.ArgumentParser:
+    """
+    Create an argument parser with the Brain daemon --ip/--port options.
+    
+    Scripts add their own flags to the returned parser.
+    """
+    parser = argparse.ArgumentParser(
+        description=description,
+        formatter_class=argparse.RawDescriptionHelpFormatter,
+        epilog=epilog,
+    )
+    parser.add_argument(
+        "--ip",
+        default="192.168.42.1",
+        help="Brain daemon IP address (default: 192.168.42.1)"
+    )
+    parser.add_argument(
+        "--port",
+        type=int,
+        default=9000,
+        help="Brain daemon port (default: 9000)"
+    )
+    return parser
@@ -9,10 +9,12 @@ Usage:
     python test_eyes.py [--ip 192.168.42.1] [--port 9000]
 """
 
-import time
+import asyncio
+import cmath
+import json
 import math
-import argparse
 from spider_client import SpiderClient
+from spider_test_common import build_client_argparser
 
 
 def print_menu():
@@ -42,24 +44,58 @@ def print_menu():
     print("=" * 50)
 
 
-def circle_animation(client: SpiderClient, duration: float = 3.0, radius: float = 0.8):
+def circle_points(n: int, step: float, radius: float):
+    """n points on a circle, step radians apart, starting at (radius, 0)."""
+    # Rotate by a fixed unit phasor instead of calling cos/sin per point
+    rot = cmath.exp(1j * step)
+    z = complex(radius, 0.0)
+    points = []
+    for _ in range(n):
+        points.append((z.real, z.imag))
+        z *= rot
+    return points
+
+
+async def circle_animation(client: SpiderClient, duration: float = 3.0, radius: float = 0.8):
     """Animate eyes in a circular pattern."""
     print(f"Running circle animation for {duration}s...")
-    start = time.time()
-    while (time.time() - start) < duration:
-        t = (time.time() - start) * 2 * math.pi / 1.5  # 1.5s per circle
-        x = radius * math.cos(t)
-        y = radius * math.sin(t)
-        client.eye_look(x, y)
-        time.sleep(0.033)  # ~30 Hz
-    client.eye_look(0, 0)  # Return to center
+    loop = asyncio.get_running_loop()
+    frame_dt = 1 / 30
+    n = int(duration / frame_dt)
+    step = frame_dt * 2 * math.pi / 1.5  # 1.5s per circle
+    points = circle_points(n, step, radius)
+
+    # Preferred: one eye_path message, paced by the Brain
+    if n <= client.EYE_PATH_MAX_POINTS and client.eye_path(points, frame_dt):
+        await asyncio.sleep(n * frame_dt)
+        client.eye_look(0, 0)  # Return to center
+        print("Circle animation complete")
+        return
+
+    # Fallback for daemons without eye_path: stream one look per frame
+    # Queue frames to the client's writer thread so sends overlap the frame wait
+    was_pipelined = client.pipelined
+    client.pipelined = True
+    try:
+        next_tick = loop.time()
+        for x, y in points:
+            client.eye_look(x, y)
+            # Absolute deadlines on the loop's monotonic clock (~30 Hz) so
+            # send time and sleep overshoot don't accumulate
+            next_tick += frame_dt
+            delay = next_tick - loop.time()
+            if delay > 0:
+                await asyncio.sleep(delay)
+            elif delay < -frame_dt:
+                next_tick = loop.time()  # Fell behind; resync instead of bursting frames
+        client.eye_look(0, 0)  # Return to center
+    finally:
+        client.pipelined = was_pipelined
     print("Circle animation complete")
 
 
 def main():
-    parser = argparse.ArgumentParser(description="Spider Eye Test Suite")
-    parser.add_argument("--ip", default="192.168.42.1", help="Brain daemon IP")
-    parser.add_argument("--port", type=int, default=9000, help="Brain daemon port")
+    parser = build_client_argparser("Spider Eye Test Suite")
     args = parser.parse_args()
 
     client = SpiderClient(host=args.ip, port=args.port)
@@ -89,7 +125,7 @@ def main():
                 client.eye_look(0, 1)
                 print("Looking down")
             elif choice == "6":
-                circle_animation(client)
+                asyncio.run(circle_animation(client))
             elif choice == "7":
                 client.eye_blink()
                 print("Blink triggered")
@@ -120,7 +156,6 @@ def main():
             elif choice == "s":
                 status = client.get_status()
                 if status:
-                    import json
                     print(f"Status: {json.dumps(status, indent=2)}")
                 else:
                     print("No status response")
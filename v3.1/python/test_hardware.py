@@ -16,23 +16,65 @@ Usage:
     python test_hardware.py --test-eyes        # Eye tests only
     python test_hardware.py --test-distance    # Distance sensor only
     python test_hardware.py --simulate         # Mock hardware responses
+    python test_hardware.py --daemon           # Connect once, re-run tests from stdin
 """
 
-import argparse
 import json
+import random
 import sys
 import time
-from dataclasses import dataclass, field
 from typing import Optional, List, Dict, Any
 
+from spider_test_common import build_client_argparser
+
+
+# Leg servo sweep: 80° -> 100° -> 90° (1389us, 1611us, 1500us), dwell per position
+SERVO_SWEEP_US = (1389, 1611, 1500)
+SERVO_SWEEP_DWELL_MS = 150
+
+# Eye test phases: (result name, header, [(label, client method, args, dwell_s)])
+EYE_TEST_PLAN = (
+    ("Eye Moods", "[1/3] Testing moods...", tuple(
+        (f"Setting mood: {mood}", "eye_mood", (mood,), 0.3)
+        for mood in ("normal", "angry", "happy", "sleepy", "normal")
+    )),
+    ("Eye Look Directions", "[2/3] Testing look directions...", tuple(
+        (f"Looking {name}", "eye_look", (x, y), 0.15)
+        for x, y, name in (
+            (0, 0, "center"),
+            (-1, 0, "left"),
+            (1, 0, "right"),
+            (0, -1, "up"),
+            (0, 1, "down"),
+            (-0.7, -0.7, "upper-left"),
+            (0.7, -0.7, "upper-right"),
+            (-0.7, 0.7, "lower-left"),
+            (0.7, 0.7, "lower-right"),
+            (0, 0, "center"),
+        )
+    )),
+    ("Eye Blink/Wink", "[3/3] Testing blink/wink...", (
+        ("Blink", "eye_blink", (), 0.5),
+        ("Wink left", "eye_wink", ("left",), 0.5),
+        ("Wink right", "eye_wink", ("right",), 0.5),
+    )),
+)
+
 
-@dataclass
 class TestResult:
     """Result of a single test."""
-    name: str
-    passed: bool
-    message: str = ""
-    details: Dict[str, Any] = field(default_factory=dict)
+    __slots__ = ("name", "passed", "message", "details")
+    
+    def __init__(self, name: str, passed: bool, message: str = "",
+                 details: Optional[Dict[str, Any]] = None):
+        self.name = name
+        self.passed = passed
+        self.message = message
+        self.details = details  # None when the test recorded no details
+    
+    def __repr__(self):
+        return (f"TestResult(name={self.name!r}, passed={self.passed!r}, "
+                f"message={self.message!r}, details={self.details!r})")
 
 
 class MockSpiderClient:
@@ -55,6 +97,7 @@ class MockSpiderClient:
         self.connected = False
         self._mock_distance = 500
         self._distance_variance = 50
+        self._rng = random.Random()
     
     def connect(self) -> bool:
         print(f"[SIMULATE] Connecting to ws://{self.host}:{self.port}...")
@@ -83,6 +126,9 @@ class MockSpiderClient:
     def set_all_servos(self, us_values: List[int]) -> bool:
         return True
     
+    def servo_script(self, steps: List[tuple]) -> Optional[int]:
+        return sum(dwell_ms for _, _, dwell_ms in steps)
+    
     def all_neutral(self) -> bool:
         return True
     
@@ -105,8 +151,12 @@ class MockSpiderClient:
         return True
     
     def get_distance(self) -> Optional[int]:
-        import random
-        return self._mock_distance + random.randint(-self._distance_variance, self._distance_variance)
+        # Single-argument randrange skips randint's range validation
+        variance = self._distance_variance
+        return self._mock_distance - variance + self._rng.randrange(2 * variance + 1)
+    
+    def get_distance_batch(self, n: int = 10, interval_ms: int = 100) -> Optional[List[Optional[int]]]:
+        return [self.get_distance() for _ in range(n)]
     
     def scan_set(self, us: int) -> bool:
         return True
@@ -125,12 +175,9 @@ class MockSpiderClient:
     
     def scan_sweep(self, min_angle: float = 0.0, max_angle: float = 180.0,
                    steps: int = 9, delay_s: float = 0.15) -> List[Optional[int]]:
-        import random
-        readings = []
-        for i in range(steps):
-            dist = self._mock_distance + random.randint(-100, 100)
-            readings.append(max(50, dist))
-        return readings
+        base = self._mock_distance - 100
+        randrange = self._rng.randrange
+        return [max(50, base + randrange(201)) for _ in range(steps)]
     
     def __enter__(self):
         self.connect()
@@ -148,14 +195,22 @@ class HardwareTestSuite:
         self.client = client
         self.verbose = verbose
         self.results: List[TestResult] = []
+        self._passed = 0
+        self._failed = 0
     
     def log(self, msg: str, end: str = "\n"):
         if self.verbose:
-            print(msg, end=end, flush=True)
+            # Only partial lines (awaiting a result) need an immediate flush;
+            # full lines go through normal stdout buffering
+            print(msg, end=end, flush=end != "\n")
     
     def add_result(self, name: str, passed: bool, message: str = "", details: Optional[Dict] = None):
-        result = TestResult(name, passed, message, details or {})
+        result = TestResult(name, passed, message, details or None)
         self.results.append(result)
+        if passed:
+            self._passed += 1
+        else:
+            self._failed += 1
         return result
     
     # =========================================================================
@@ -224,33 +279,42 @@ class HardwareTestSuite:
         # Test 2: Individual leg servo tests (80° -> 100° -> 90°)
         self.log("\n  [2/3] Testing individual leg servos...")
         
-        for leg in range(4):
-            leg_name = self.client.LEG_NAMES[leg]
-            channels = self.client.LEG_CHANNELS[leg]
+        legs = [(leg, self.client.LEG_NAMES[leg], self.client.LEG_CHANNELS[leg]) for leg in range(4)]
+        
+        # Preferred: every joint in one script, timed by the Brain
+        plan = [(channel, us, SERVO_SWEEP_DWELL_MS)
+                for _, _, channels in legs for channel in channels for us in SERVO_SWEEP_US]
+        try:
+            duration_ms = self.client.servo_script(plan)
+        except Exception as e:
+            self.log(f"    servo_script failed ({e}), stepping individually")
+            duration_ms = None
+        if duration_ms is not None:
+            time.sleep(duration_ms / 1000.0)
+        
+        for leg, leg_name, channels in legs:
             self.log(f"    Leg {leg} ({leg_name}):")
-            
             for joint_idx, channel in enumerate(channels):
                 joint_name = self.client.JOINT_NAMES[joint_idx]
-                self.log(f"      CH{channel} ({joint_name}): ", end="")
+                result_name = f"Servo CH{channel} ({leg_name}/{joint_name})"
+                if duration_ms is not None:
+                    self.log(f"      CH{channel} ({joint_name}): OK")
+                    self.add_result(result_name, True)
+                    continue
                 
+                # Fallback for daemons without servo_script
+                self.log(f"      CH{channel} ({joint_name}): ", end="")
                 try:
-                    # Convert degrees to microseconds: 80° -> 1389us, 100° -> 1611us, 90° -> 1500us
-                    positions = [
-                        (1389, "80°"),   # 80 degrees
-                        (1611, "100°"),  # 100 degrees
-                        (1500, "90°"),   # 90 degrees (neutral)
-                    ]
-                    
-                    for us, _ in positions:
+                    for us in SERVO_SWEEP_US:
                         self.client.set_servo(channel, us)
-                        time.sleep(0.15)
+                        time.sleep(SERVO_SWEEP_DWELL_MS / 1000.0)
                     
                     self.log("OK")
-                    self.add_result(f"Servo CH{channel} ({leg_name}/{joint_name})", True)
+                    self.add_result(result_name, True)
                 except Exception as e:
                     self.log(f"FAILED ({e})")
                     failed_channels.append(channel)
-                    self.add_result(f"Servo CH{channel} ({leg_name}/{joint_name})", False, str(e))
+                    self.add_result(result_name, False, str(e))
                     all_passed = False
         
         # Test 3: Scan servo sweep
@@ -293,100 +357,27 @@ class HardwareTestSuite:
         
         all_passed = True
         
-        # Test 1: Moods
-        self.log("\n  [1/3] Testing moods...")
-        moods = ["normal", "angry", "happy", "sleepy", "normal"]
-        for mood in moods:
-            self.log(f"    Setting mood: {mood}...", end=" ")
-            try:
-                if self.client.eye_mood(mood):
+        for result_name, header, steps in EYE_TEST_PLAN:
+            self.log(f"\n  {header}")
+            phase_passed = True
+            for label, method, args, dwell_s in steps:
+                self.log(f"    {label}...", end=" ")
+                try:
+                    ok = getattr(self.client, method)(*args)
+                except Exception as e:
+                    self.log(f"ERROR: {e}")
+                    phase_passed = False
+                    continue
+                if ok:
                     self.log("OK")
-                    time.sleep(0.3)
+                    time.sleep(dwell_s)
                 else:
                     self.log("FAILED")
-                    all_passed = False
-            except Exception as e:
-                self.log(f"ERROR: {e}")
+                    phase_passed = False
+            
+            self.add_result(result_name, phase_passed)
+            if not phase_passed:
                 all_passed = False
-        self.add_result("Eye Moods", all_passed)
-        
-        # Test 2: Look directions
-        self.log("\n  [2/3] Testing look directions...")
-        directions = [
-            (0, 0, "center"),
-            (-1, 0, "left"),
-            (1, 0, "right"),
-            (0, -1, "up"),
-            (0, 1, "down"),
-            (-0.7, -0.7, "upper-left"),
-            (0.7, -0.7, "upper-right"),
-            (-0.7, 0.7, "lower-left"),
-            (0.7, 0.7, "lower-right"),
-            (0, 0, "center"),
-        ]
-        
-        look_passed = True
-        for x, y, name in directions:
-            self.log(f"    Looking {name}...", end=" ")
-            try:
-                if self.client.eye_look(x, y):
-                    self.log("OK")
-                    time.sleep(0.15)
-                else:
-                    self.log("FAILED")
-                    look_passed = False
-            except Exception as e:
-                self.log(f"ERROR: {e}")
-                look_passed = False
-        
-        self.add_result("Eye Look Directions", look_passed)
-        if not look_passed:
-            all_passed = False
-        
-        # Test 3: Blink and wink
-        self.log("\n  [3/3] Testing blink/wink...")
-        
-        blink_passed = True
-        
-        self.log("    Blink...", end=" ")
-        try:
-            if self.client.eye_blink():
-                self.log("OK")
-                time.sleep(0.5)
-            else:
-                self.log("FAILED")
-                blink_passed = False
-        except Exception as e:
-            self.log(f"ERROR: {e}")
-            blink_passed = False
-        
-        self.log("    Wink left...", end=" ")
-        try:
-            if self.client.eye_wink("left"):
-                self.log("OK")
-                time.sleep(0.5)
-            else:
-                self.log("FAILED")
-                blink_passed = False
-        except Exception as e:
-            self.log(f"ERROR: {e}")
-            blink_passed = False
-        
-        self.log("    Wink right...", end=" ")
-        try:
-            if self.client.eye_wink("right"):
-                self.log("OK")
-                time.sleep(0.5)
-            else:
-                self.log("FAILED")
-                blink_passed = False
-        except Exception as e:
-            self.log(f"ERROR: {e}")
-            blink_passed = False
-        
-        self.add_result("Eye Blink/Wink", blink_passed)
-        if not blink_passed:
-            all_passed = False
         
         # Reset to normal
         self.client.eye_mood("normal")
@@ -407,41 +398,49 @@ class HardwareTestSuite:
         
         self.log("\n  Taking 10 readings...")
         
-        readings = []
+        count = 0
         errors = 0
+        min_dist = max_dist = total = 0
         
-        for i in range(10):
-            self.log(f"    Reading {i + 1}/10...", end=" ")
-            try:
-                dist = self.client.get_distance()
-                if dist is not None:
-                    readings.append(dist)
-                    self.log(f"{dist} mm")
-                else:
-                    errors += 1
-                    self.log("ERROR (no response)")
-                time.sleep(0.1)
-            except Exception as e:
+        # Preferred: all readings in one request, paced by the Brain
+        try:
+            samples = self.client.get_distance_batch(10, 100)
+        except Exception as e:
+            self.log(f"    Batch read failed ({e}), reading individually")
+            samples = None
+        if samples is None:
+            # Fallback for daemons without distance_batch
+            samples = self._read_distances(10, 0.1)
+        
+        # Fold min/max/sum while logging, instead of separate passes afterwards
+        for i, dist in enumerate(samples):
+            if dist is None:
                 errors += 1
-                self.log(f"ERROR: {e}")
+                self.log(f"    Reading {i + 1}/10... ERROR (no response)")
+                continue
+            self.log(f"    Reading {i + 1}/10... {dist} mm")
+            if count == 0 or dist < min_dist:
+                min_dist = dist
+            if count == 0 or dist > max_dist:
+                max_dist = dist
+            total += dist
+            count += 1
         
         # Calculate statistics
-        if readings:
-            min_dist = min(readings)
-            max_dist = max(readings)
-            avg_dist = sum(readings) / len(readings)
+        if count:
+            avg_dist = total / count
             
             self.log("\n  Results:")
-            self.log(f"    Successful readings: {len(readings)}/10")
+            self.log(f"    Successful readings: {count}/10")
             self.log(f"    Errors: {errors}")
             self.log(f"    Min: {min_dist} mm")
             self.log(f"    Max: {max_dist} mm")
             self.log(f"    Avg: {avg_dist:.1f} mm")
             self.log(f"    Range variance: {max_dist - min_dist} mm")
             
-            passed = len(readings) >= 5  # At least 50% success rate
+            passed = count >= 5  # At least 50% success rate
             self.add_result("Distance Sensor", passed, details={
-                "readings": len(readings),
+                "readings": count,
                 "errors": errors,
                 "min_mm": min_dist,
                 "max_mm": max_dist,
@@ -455,6 +454,16 @@ class HardwareTestSuite:
         self.log(f"\n  Distance sensor test: {'PASSED' if passed else 'FAILED'}")
         return passed
     
+    def _read_distances(self, n: int, interval_s: float):
+        """Yield n individual get_distance() readings (None on error)."""
+        for _ in range(n):
+            try:
+                yield self.client.get_distance()
+            except Exception as e:
+                self.log(f"    ERROR: {e}")
+                yield None
+            time.sleep(interval_s)
+    
     # =========================================================================
     # Coordinated System Test
     # =========================================================================
@@ -476,15 +485,25 @@ class HardwareTestSuite:
             
             # Perform sweep with distance readings
             angles = [0, 45, 90, 135, 180]
+            settle_s = 0.3
             
-            for angle in angles:
-                # Move scan servo
-                self.client.scan_angle(angle)
-                time.sleep(0.3)
+            self.client.scan_angle(angles[0])
+            settle_deadline = time.monotonic() + settle_s
+            
+            for i, angle in enumerate(angles):
+                # Wait for the scan servo to settle
+                slack = settle_deadline - time.monotonic()
+                if slack > 0:
+                    time.sleep(slack)
                 
                 # Read distance
                 dist = self.client.get_distance()
                 
+                # Start moving to the next angle while the eyes react to this one
+                if i + 1 < len(angles):
+                    self.client.scan_angle(angles[i + 1])
+                    settle_deadline = time.monotonic() + settle_s
+                
                 # Calculate normalized look direction (map angle to x: -1 to 1)
                 look_x = (angle - 90) / 90.0  # 0° -> -1, 90° -> 0, 180° -> 1
                 self.client.eye_look(look_x, 0)
@@ -505,8 +524,8 @@ class HardwareTestSuite:
                     self.log(f"    Angle {angle:3d}°: {dist:4d}mm -> {mood_desc}")
                 else:
                     self.log(f"    Angle {angle:3d}°: --error--")
-                
-                time.sleep(0.2)
+            
+            time.sleep(0.2)  # Let the last reaction show
             
             # Return to center
             self.client.scan_center()
@@ -533,8 +552,8 @@ class HardwareTestSuite:
         self.log("TEST REPORT")
         self.log("=" * 60)
         
-        passed = sum(1 for r in self.results if r.passed)
-        failed = sum(1 for r in self.results if not r.passed)
+        passed = self._passed
+        failed = self._failed
         total = len(self.results)
         
         self.log(f"\n  Total Tests: {total}")
@@ -546,10 +565,9 @@ class HardwareTestSuite:
         self.log("  Details:")
         self.log("  " + "-" * 56)
         
+        labels = ("[FAIL] X", "[PASS] +")
         for result in self.results:
-            status = "PASS" if result.passed else "FAIL"
-            icon = "+" if result.passed else "X"
-            self.log(f"    [{status}] {icon} {result.name}")
+            self.log(f"    {labels[bool(result.passed)]} {result.name}")
             if result.message and not result.passed:
                 self.log(f"           -> {result.message}")
         
@@ -574,10 +592,55 @@ class HardwareTestSuite:
         return self.print_report()
 
 
+FULL_TEST_ORDER = ("servos", "eyes", "distance", "coordinated")
+
+
+def run_suite(client, tests: List[str], verbose: bool = True) -> bool:
+    """Run the connection test plus the named tests on an open client."""
+    suite = HardwareTestSuite(client, verbose=verbose)
+    
+    # Run connection test first (always)
+    suite.test_connection()
+    for name in tests:
+        getattr(suite, f"test_{name}")()
+    
+    return suite.print_report()
+
+
+def run_daemon(client, verbose: bool = True) -> int:
+    """
+    Re-run tests on demand over one connection.
+    
+    Reads lines like "servos eyes" or "all" from stdin until "quit"/EOF,
+    so repeated runs skip the WebSocket handshake.
+    """
+    print(f"\nReady. Tests: {', '.join(FULL_TEST_ORDER)}, all, quit")
+    last_passed = True
+    while True:
+        try:
+            line = input("test> ").strip().lower()
+        except EOFError:
+            break
+        if line in ("quit", "q", "exit"):
+            break
+        if not line:
+            continue
+        
+        names = line.split()
+        if names == ["all"]:
+            names = list(FULL_TEST_ORDER)
+        unknown = [n for n in names if n not in FULL_TEST_ORDER]
+        if unknown:
+            print(f"Unknown test(s): {', '.join(unknown)}")
+            continue
+        last_passed = run_suite(client, names, verbose=verbose)
+    
+    return 0 if last_passed else 1
+
+
 def main():
-    parser = argparse.ArgumentParser(
-        description="Spider Robot v3.1 - Master Hardware Test Suite",
-        formatter_class=argparse.RawDescriptionHelpFormatter,
+    parser = build_client_argparser(
+        "Spider Robot v3.1 - Master Hardware Test Suite",
         epilog="""
 Examples:
   python test_hardware.py                     # Full system test
@@ -586,19 +649,9 @@ Examples:
   python test_hardware.py --test-distance     # Test distance sensor only
   python test_hardware.py --simulate          # Run with mock hardware
   python test_hardware.py --simulate --test-servos  # Mock servo test
+  python test_hardware.py --daemon            # Connect once, re-run tests from stdin
 """
     )
-    parser.add_argument(
-        "--ip",
-        default="192.168.42.1",
-        help="Brain daemon IP address (default: 192.168.42.1)"
-    )
-    parser.add_argument(
-        "--port",
-        type=int,
-        default=9000,
-        help="Brain daemon port (default: 9000)"
-    )
     parser.add_argument(
         "--test-servos",
         action="store_true",
@@ -624,11 +677,20 @@ Examples:
         action="store_true",
         help="Reduce output verbosity"
     )
+    parser.add_argument(
+        "--daemon",
+        action="store_true",
+        help="Keep the connection open and read test names to run from stdin"
+    )
     
     args = parser.parse_args()
     
     # Determine which tests to run
-    run_specific = args.test_servos or args.test_eyes or args.test_distance
+    tests = [name for name, flag in (("servos", args.test_servos),
+                                     ("eyes", args.test_eyes),
+                                     ("distance", args.test_distance)) if flag]
+    if not tests:
+        tests = list(FULL_TEST_ORDER)
     
     # Create client (real or mock)
     if args.simulate:
@@ -659,31 +721,11 @@ Examples:
         print(f"  3. No firewall blocking port {args.port}")
         return 1
     
-    # Create test suite
-    suite = HardwareTestSuite(client, verbose=not args.quiet)
-    
     try:
-        # Run connection test first (always)
-        suite.test_connection()
-        
-        if run_specific:
-            # Run specific tests
-            if args.test_servos:
-                suite.test_servos()
-            if args.test_eyes:
-                suite.test_eyes()
-            if args.test_distance:
-                suite.test_distance()
-        else:
-            # Run full system test
-            suite.test_servos()
-            suite.test_eyes()
-            suite.test_distance()
-            suite.test_coordinated()
-        
-        # Print report
-        all_passed = suite.print_report()
+        if args.daemon:
+            return run_daemon(client, verbose=not args.quiet)
         
+        all_passed = run_suite(client, tests, verbose=not args.quiet)
         return 0 if all_passed else 1
         
     except KeyboardInterrupt:
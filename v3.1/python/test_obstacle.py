@@ -13,6 +13,7 @@ Usage:
 """
 
 import argparse
+import io
 import sys
 import time
 import logging
@@ -25,81 +26,85 @@ except ImportError:
     SpiderClient = None
 
 
-def print_action_recommendation(action: Action, distance: int = None):
-    """Print action with visual indicator."""
-    symbols = {
-        Action.FORWARD: "^^ FORWARD",
-        Action.SLOW_FORWARD: "^  SLOW FORWARD",
-        Action.TURN_LEFT: "<< TURN LEFT",
-        Action.TURN_RIGHT: ">> TURN RIGHT",
-        Action.BACKUP: "vv BACKUP",
-        Action.STOP: "## STOP",
-    }
-    
-    symbol = symbols.get(action, str(action))
+# Top-down view grid, reused across redraws in continuous mode
+GRID_WIDTH = 40
+GRID_HEIGHT = 10
+_GRID_BLANK = b' ' * (GRID_WIDTH * GRID_HEIGHT)
+_grid = bytearray(_GRID_BLANK)
+_MARK_ROBOT, _MARK_CRITICAL, _MARK_WARNING, _MARK_CLEAR = b"R!*."
+
+
+_ACTION_SYMBOLS = {
+    Action.FORWARD: "^^ FORWARD",
+    Action.SLOW_FORWARD: "^  SLOW FORWARD",
+    Action.TURN_LEFT: "<< TURN LEFT",
+    Action.TURN_RIGHT: ">> TURN RIGHT",
+    Action.BACKUP: "vv BACKUP",
+    Action.STOP: "## STOP",
+}
+
+
+def print_action_recommendation(action: Action, distance: int = None, out=None):
+    """Print action with visual indicator (to out, default stdout)."""
+    symbol = _ACTION_SYMBOLS.get(action, str(action))
     dist_str = f" (front: {distance}mm)" if distance else ""
-    print(f"\nRecommended: {symbol}{dist_str}")
+    (out or sys.stdout).write(f"\nRecommended: {symbol}{dist_str}\n")
 
 
-def print_scan_visualization(scan: ScanData, oa: ObstacleAvoidance):
-    """Print ASCII scan visualization with polar-ish display."""
+def print_scan_visualization(scan: ScanData, oa: ObstacleAvoidance, out=None):
+    """Print ASCII scan visualization with polar-ish display (one write to out, default stdout)."""
+    out = out or sys.stdout
     if not scan or not scan.angles:
-        print("No scan data")
+        out.write("No scan data\n")
         return
     
-    print("\n" + "=" * 50)
-    print("SCAN RESULTS")
-    print("=" * 50)
-    
-    # Text-based visualization
-    print(oa.format_scan_ascii(scan))
-    
-    # Simple top-down view
-    print("\nTop-Down View (Robot at bottom):")
-    print("         Left  Center  Right")
+    lines = [
+        "\n" + "=" * 50,
+        "SCAN RESULTS",
+        "=" * 50,
+        # Text-based visualization
+        oa.format_scan_ascii(scan),
+        # Simple top-down view
+        "\nTop-Down View (Robot at bottom):",
+        "         Left  Center  Right",
+    ]
     
     max_dist = scan.max_distance or 1000
     
     # Build a simple grid
-    width = 40
-    height = 10
-    grid = [[' ' for _ in range(width)] for _ in range(height)]
+    width = GRID_WIDTH
+    height = GRID_HEIGHT
+    grid = _grid
+    grid[:] = _GRID_BLANK
     
     # Mark robot position
     robot_x = width // 2
     robot_y = height - 1
-    grid[robot_y][robot_x] = 'R'
+    grid[robot_y * width + robot_x] = _MARK_ROBOT
     
-    # Mark obstacles based on scan
+    # Mark obstacles based on scan (everything the loop reads is a local)
+    rows = height - 2
+    cols = width - 2
+    top_y = robot_y - 1
+    critical, warning = oa.critical_distance, oa.warning_distance
     for angle, dist in zip(scan.angles, scan.distances):
-        if dist is None:
+        if dist < 0:
             continue
         
-        # Convert polar to cartesian-ish
-        import math
-        rad = math.radians(angle)
-        # Scale distance to grid
-        scaled_dist = min(height - 2, int((dist / max_dist) * (height - 2)))
-        
-        # X position: angle 30° = right edge, 150° = left edge
-        x_ratio = (angle - 30) / 120  # 0 at 30°, 1 at 150°
-        x = int(x_ratio * (width - 2)) + 1
-        y = robot_y - scaled_dist - 1
+        # Convert polar to cartesian-ish; integer scaling of the distance
+        x = int((angle - 30) / 120 * cols) + 1  # 30° = right edge, 150° = left edge
+        y = top_y - min(rows, dist * rows // max_dist)
         
         if 0 <= x < width and 0 <= y < height:
-            if dist <= oa.critical_distance:
-                grid[y][x] = '!'
-            elif dist <= oa.warning_distance:
-                grid[y][x] = '*'
-            else:
-                grid[y][x] = '.'
+            grid[y * width + x] = (_MARK_CRITICAL if dist <= critical
+                                   else _MARK_WARNING if dist <= warning else _MARK_CLEAR)
     
-    # Print grid
-    print("  +" + "-" * width + "+")
-    for row in grid:
-        print("  |" + "".join(row) + "|")
-    print("  +" + "-" * width + "+")
-    print("  Legend: R=Robot  !=Critical  *=Warning  .=Clear")
+    border = "  +" + "-" * width + "+"
+    lines.append(border)
+    lines += ["  |" + grid[i:i + width].decode('ascii') + "|" for i in range(0, len(grid), width)]
+    lines.append(border)
+    lines.append("  Legend: R=Robot  !=Critical  *=Warning  .=Clear\n")
+    out.write("\n".join(lines))
 
 
 def run_single_test(oa: ObstacleAvoidance):
@@ -120,24 +125,111 @@ def run_continuous_mode(oa: ObstacleAvoidance, interval: float = 1.0):
     print(f"Scan interval: {interval}s")
     
     try:
+        # Clear once; later frames overwrite in place (cursor home, clear each
+        # line's tail, clear below) so the terminal doesn't repaint everything
+        sys.stdout.write("\033[2J")
         while True:
-            # Clear screen (works on most terminals)
-            print("\033[2J\033[H", end="")
-            
             scan = oa.scan_environment()
-            print_scan_visualization(scan, oa)
-            
             action = oa.get_recommended_action(use_cached_scan=True)
             _, front_dist = oa.check_front()
-            print_action_recommendation(action, front_dist)
             
-            print(f"\nNext scan in {interval}s... (Ctrl+C to stop)")
+            frame = io.StringIO()
+            print_scan_visualization(scan, oa, frame)
+            print_action_recommendation(action, front_dist, frame)
+            frame.write(f"\nNext scan in {interval}s... (Ctrl+C to stop)\n")
+            
+            # One write per frame
+            sys.stdout.write("\033[H" + frame.getvalue().replace("\n", "\033[K\n") + "\033[J")
+            sys.stdout.flush()
             time.sleep(interval)
             
     except KeyboardInterrupt:
         print("\nStopped continuous mode")
 
 
+def _cmd_scan(oa, client, state):
+    run_single_test(oa)
+
+
+def _cmd_front(oa, client, state):
+    is_safe, dist = oa.check_front()
+    status = "SAFE" if is_safe else "OBSTACLE"
+    print(f"Front check: {dist}mm - {status}")
+
+
+def _cmd_action(oa, client, state):
+    action = oa.get_recommended_action()
+    _, front_dist = oa.check_front()
+    print_action_recommendation(action, front_dist)
+
+
+def _point_and_read(oa, client, move, label):
+    if client and not oa._simulate:
+        getattr(client, move)()
+        time.sleep(0.15)
+        dist = oa._get_distance()
+        print(f"{label}: {dist}mm")
+
+
+def _cmd_left(oa, client, state):
+    _point_and_read(oa, client, "scan_left", "Left (135°)")
+
+
+def _cmd_right(oa, client, state):
+    _point_and_read(oa, client, "scan_right", "Right (45°)")
+
+
+def _cmd_center(oa, client, state):
+    _point_and_read(oa, client, "scan_center", "Center (90°)")
+
+
+def _cmd_eyes(oa, client, state):
+    if client:
+        state["eyes"] = not state["eyes"]
+        if state["eyes"]:
+            oa.integrate_with_eyes(client)
+            print("Eye integration: ENABLED")
+        else:
+            oa.set_eye_callbacks(None, None, None)
+            print("Eye integration: DISABLED")
+    else:
+        print("No client connected")
+
+
+def _cmd_thresholds(oa, client, state):
+    print(f"Current thresholds (mm):")
+    print(f"  Critical: {oa.critical_distance}")
+    print(f"  Warning:  {oa.warning_distance}")
+    print(f"  Safe:     {oa.safe_distance}")
+    
+    try:
+        new_val = input("Set new values? (critical warning safe, or Enter to skip): ").strip()
+        if new_val:
+            parts = new_val.split()
+            if len(parts) == 3:
+                oa.critical_distance = int(parts[0])
+                oa.warning_distance = int(parts[1])
+                oa.safe_distance = int(parts[2])
+                print("Thresholds updated")
+    except ValueError:
+        print("Invalid input")
+
+
+# Interactive command table: aliases -> handler(oa, client, state)
+_COMMANDS = {
+    ("s", "scan"): _cmd_scan,
+    ("f", "front"): _cmd_front,
+    ("a", "action"): _cmd_action,
+    ("l", "left"): _cmd_left,
+    ("r", "right"): _cmd_right,
+    ("c", "center"): _cmd_center,
+    ("e", "eyes"): _cmd_eyes,
+    ("t", "thresholds"): _cmd_thresholds,
+}
+_COMMAND_LOOKUP = {alias: handler for aliases, handler in _COMMANDS.items() for alias in aliases}
+_QUIT_COMMANDS = frozenset(("q", "quit", "exit"))
+
+
 def run_interactive_mode(oa: ObstacleAvoidance, client):
     """Interactive testing mode with commands."""
     print("\nInteractive Obstacle Avoidance Test")
@@ -154,7 +246,7 @@ def run_interactive_mode(oa: ObstacleAvoidance, client):
     print("  q, quit     - Exit")
     print()
     
-    eyes_enabled = False
+    state = {"eyes": False}
     
     while True:
         try:
@@ -168,73 +260,12 @@ def run_interactive_mode(oa: ObstacleAvoidance, client):
         if not cmd:
             continue
         
-        if cmd in ('q', 'quit', 'exit'):
+        if cmd in _QUIT_COMMANDS:
             break
         
-        elif cmd in ('s', 'scan'):
-            run_single_test(oa)
-        
-        elif cmd in ('f', 'front'):
-            is_safe, dist = oa.check_front()
-            status = "SAFE" if is_safe else "OBSTACLE"
-            print(f"Front check: {dist}mm - {status}")
-        
-        elif cmd in ('a', 'action'):
-            action = oa.get_recommended_action()
-            _, front_dist = oa.check_front()
-            print_action_recommendation(action, front_dist)
-        
-        elif cmd in ('l', 'left'):
-            if client and not oa._simulate:
-                client.scan_left()
-                time.sleep(0.15)
-                dist = oa._get_distance()
-                print(f"Left (135°): {dist}mm")
-        
-        elif cmd in ('r', 'right'):
-            if client and not oa._simulate:
-                client.scan_right()
-                time.sleep(0.15)
-                dist = oa._get_distance()
-                print(f"Right (45°): {dist}mm")
-        
-        elif cmd in ('c', 'center'):
-            if client and not oa._simulate:
-                client.scan_center()
-                time.sleep(0.15)
-                dist = oa._get_distance()
-                print(f"Center (90°): {dist}mm")
-        
-        elif cmd in ('e', 'eyes'):
-            if client:
-                eyes_enabled = not eyes_enabled
-                if eyes_enabled:
-                    oa.integrate_with_eyes(client)
-                    print("Eye integration: ENABLED")
-                else:
-                    oa.set_eye_callbacks(None, None, None)
-                    print("Eye integration: DISABLED")
-            else:
-                print("No client connected")
-        
-        elif cmd in ('t', 'thresholds'):
-            print(f"Current thresholds (mm):")
-            print(f"  Critical: {oa.critical_distance}")
-            print(f"  Warning:  {oa.warning_distance}")
-            print(f"  Safe:     {oa.safe_distance}")
-            
-            try:
-                new_val = input("Set new values? (critical warning safe, or Enter to skip): ").strip()
-                if new_val:
-                    parts = new_val.split()
-                    if len(parts) == 3:
-                        oa.critical_distance = int(parts[0])
-                        oa.warning_distance = int(parts[1])
-                        oa.safe_distance = int(parts[2])
-                        print("Thresholds updated")
-            except ValueError:
-                print("Invalid input")
-        
+        handler = _COMMAND_LOOKUP.get(cmd)
+        if handler:
+            handler(oa, client, state)
         else:
             print(f"Unknown command: {cmd}")
 
@@ -10,6 +10,11 @@ import time
 import sys
 from spider_client import SpiderClient
 
+_DASH40 = "-" * 40
+
+# Distance bars for the sweep table, indexed by width (1 char per 20mm, max 50)
+_BARS = tuple("#" * n for n in range(51))
+
 
 def test_basic_motion(client: SpiderClient):
     """Test basic scan servo positions."""
@@ -47,18 +52,16 @@ def test_sweep(client: SpiderClient):
     print("\n=== Sweep Test ===")
     print("Performing 9-point sweep (0° to 180°)...")
     
-    readings = client.scan_sweep(min_angle=0, max_angle=180, steps=9, delay_s=0.2)
+    steps = 9
+    readings = client.scan_sweep(min_angle=0, max_angle=180, steps=steps, delay_s=0.2)
     
-    print("\nResults:")
-    print("-" * 40)
-    for i, dist in enumerate(readings):
-        angle = i * (180 / 8)
-        if dist is not None:
-            bar = "#" * min(50, dist // 20)
-            print(f"  {angle:5.1f}°: {dist:4d}mm {bar}")
-        else:
-            print(f"  {angle:5.1f}°: --error--")
-    print("-" * 40)
+    angles = [i * 180 / (steps - 1) for i in range(steps)]
+    lines = ["\nResults:", _DASH40]
+    lines += [f"  {angle:5.1f}°: {dist:4d}mm {_BARS[min(50, dist // 20)]}"
+              if dist is not None else f"  {angle:5.1f}°: --error--"
+              for angle, dist in zip(angles, readings)]
+    lines.append(_DASH40)
+    print("\n".join(lines))
     
     # Return to center
     print("Returning to center...")
@@ -72,27 +75,46 @@ def test_continuous_scan(client: SpiderClient, duration: float = 5.0):
     """Continuous back-and-forth scanning."""
     print(f"\n=== Continuous Scan Test ({duration}s) ===")
     
-    start = time.time()
+    period = 0.05
     angle = 90.0
     direction = 1
     speed = 90.0  # degrees per second
-    
-    while (time.time() - start) < duration:
+    prev_angle = None  # Angle of the distance query still in flight
+    
+    start = last = time.monotonic()
+    next_tick = start + period
+    end = start + duration
+    while last < end:
+        # Reply to last step's query arrived during the sleep; no round trip here
+        if prev_angle is not None:
+            dist = client.read_distance()
+            if dist is not None:
+                print(f"  {prev_angle:5.1f}°: {dist:4d}mm", end="\r")
+        
         client.scan_angle(angle)
+        client.request_distance()
+        prev_angle = angle
         
-        # Read distance at current position
-        dist = client.get_distance()
-        if dist is not None:
-            print(f"  {angle:5.1f}°: {dist:4d}mm", end="\r")
+        # Sleep to the next tick on an absolute deadline so overshoot doesn't
+        # accumulate; resync if a step ran a whole period late
+        remaining = next_tick - time.monotonic()
+        if remaining > 0:
+            time.sleep(remaining)
+            next_tick += period
+        else:
+            next_tick = time.monotonic() + period
         
-        time.sleep(0.05)
-        angle += direction * speed * 0.05
+        # Advance by the time that actually passed
+        now = time.monotonic()
+        angle += direction * speed * (now - last)
+        last = now
         
         if angle >= 160:
             direction = -1
         elif angle <= 20:
             direction = 1
     
+    client.read_distance()
     print("\nContinuous scan complete!")
     client.scan_center()
 
@@ -12,12 +12,27 @@ import sys
 
 DUO_IP = "192.168.42.1"
 DUO_PASS = "milkv"
+SSH_CONTROL_PATH = "/tmp/spider-ssh-ctl"  # Inside WSL
+SSH_OPTS = f"-o StrictHostKeyChecking=no -o ControlPath={SSH_CONTROL_PATH}"
+
+def _wsl_bash(cmd, timeout=10):
+    return subprocess.run(['wsl', '-e', 'bash', '-c', cmd],
+                          capture_output=True, text=True, timeout=timeout)
+
+def ssh_open_master():
+    """Open a shared SSH connection; later ssh_cmd calls reuse it (no new handshake)"""
+    # Master runs in the background; its output goes to /dev/null so the
+    # captured pipes close when the foreground ssh returns
+    _wsl_bash(f'sshpass -p {DUO_PASS} ssh {SSH_OPTS} -o ControlMaster=yes '
+              f'-o ControlPersist=60s -fN root@{DUO_IP} >/dev/null 2>&1')
+
+def ssh_close_master():
+    _wsl_bash(f'ssh {SSH_OPTS} -O exit root@{DUO_IP} >/dev/null 2>&1')
 
 def ssh_cmd(cmd):
-    """Run command on Duo via SSH"""
-    full_cmd = f'sshpass -p {DUO_PASS} ssh -o StrictHostKeyChecking=no root@{DUO_IP} "{cmd}"'
-    result = subprocess.run(['wsl', '-e', 'bash', '-c', full_cmd], 
-                          capture_output=True, text=True, timeout=10)
+    """Run command on Duo via SSH (over the shared connection if open)"""
+    full_cmd = f'sshpass -p {DUO_PASS} ssh {SSH_OPTS} root@{DUO_IP} "{cmd}"'
+    result = _wsl_bash(full_cmd)
     return result.stdout.strip(), result.returncode
 
 def test_serial():
@@ -26,6 +41,13 @@ def test_serial():
     print("=" * 50)
     print()
     
+    ssh_open_master()
+    try:
+        return _run_serial_test()
+    finally:
+        ssh_close_master()
+
+def _run_serial_test():
     # Setup serial port
     print("[1] Configuring serial port...")
     ssh_cmd("stty -F /dev/ttyS0 115200 cs8 -cstopb -parenb")
@@ -50,9 +72,8 @@ def test_serial():
     
     for cmd, desc in commands:
         print(f"    TX: {cmd:20} ({desc})")
-        # Send command
-        ssh_cmd(f"echo '{cmd}' > /dev/ttyS0")
-        time.sleep(0.3)
+    # Send all commands in one remote script; the 0.3s pacing runs on the Duo
+    ssh_cmd("; ".join(f"echo '{cmd}' > /dev/ttyS0; sleep 0.3" for cmd, _ in commands))
     
     print("-" * 50)
     print()
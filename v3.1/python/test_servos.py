@@ -17,12 +17,19 @@ import sys
 
 from spider_client import SpiderClient
 
+# Banner rules
+_BAR50 = "=" * 50
+_BAR60 = "=" * 60
+
+# Per-joint check in test_individual_legs: (us, dwell_ms) steps
+LEG_JOINT_STEPS = ((1400, 300), (1600, 300), (1500, 200))
+
 
 def test_single_servo_sweep(client: SpiderClient, channel: int = 0) -> bool:
     """Test a single servo with a sweep pattern: 1000 → 2000 → 1500."""
-    print(f"\n{'='*50}")
+    print("\n" + _BAR50)
     print(f"TEST: Single Servo Sweep (Channel {channel})")
-    print(f"{'='*50}")
+    print(_BAR50)
     
     positions = [
         (1000, "minimum (1000us)"),
@@ -45,9 +52,9 @@ def test_single_servo_sweep(client: SpiderClient, channel: int = 0) -> bool:
 
 def test_all_servos_neutral(client: SpiderClient) -> bool:
     """Test setting all 12 servos to neutral position."""
-    print(f"\n{'='*50}")
+    print("\n" + _BAR50)
     print("TEST: All Servos to Neutral")
-    print(f"{'='*50}")
+    print(_BAR50)
     
     print("  Setting all 12 servos to 1500us...", end=" ", flush=True)
     if client.all_neutral():
@@ -62,9 +69,9 @@ def test_all_servos_neutral(client: SpiderClient) -> bool:
 
 def test_estop(client: SpiderClient) -> bool:
     """Test emergency stop functionality."""
-    print(f"\n{'='*50}")
+    print("\n" + _BAR50)
     print("TEST: Emergency Stop (E-STOP)")
-    print(f"{'='*50}")
+    print(_BAR50)
     
     print("  Sending E-STOP command...", end=" ", flush=True)
     if client.estop():
@@ -78,9 +85,9 @@ def test_estop(client: SpiderClient) -> bool:
 
 def test_status(client: SpiderClient) -> bool:
     """Test status query."""
-    print(f"\n{'='*50}")
+    print("\n" + _BAR50)
     print("TEST: Status Query")
-    print(f"{'='*50}")
+    print(_BAR50)
     
     print("  Requesting status...", end=" ", flush=True)
     status = client.get_status()
@@ -96,45 +103,72 @@ def test_status(client: SpiderClient) -> bool:
 
 def test_individual_legs(client: SpiderClient) -> bool:
     """Test each leg individually."""
-    print(f"\n{'='*50}")
+    print("\n" + _BAR50)
     print("TEST: Individual Leg Test")
-    print(f"{'='*50}")
+    print(_BAR50)
     
     # First, set all to neutral
     client.all_neutral()
     time.sleep(0.5)
     
-    for leg in range(4):
-        leg_name = client.LEG_NAMES[leg]
-        channels = client.LEG_CHANNELS[leg]
-        print(f"\n  Testing Leg {leg} ({leg_name}) - Channels {channels}")
+    # Flat (leg, leg_name, joint_idx, joint_name, channel, script) plan, built once
+    plan = [(leg, client.LEG_NAMES[leg], joint_idx, client.JOINT_NAMES[joint_idx], channel,
+             [(channel, us, dwell_ms) for us, dwell_ms in LEG_JOINT_STEPS])
+            for leg in range(4)
+            for joint_idx, channel in enumerate(client.LEG_CHANNELS[leg])]
+    
+    use_script = True
+    for leg, leg_name, joint_idx, joint_name, channel, script in plan:
+        if joint_idx == 0:
+            print(f"\n  Testing Leg {leg} ({leg_name}) - Channels {client.LEG_CHANNELS[leg]}")
+        print(f"    {joint_name} (ch {channel}): ", end="", flush=True)
         
-        # Test each joint in the leg
-        for joint_idx, channel in enumerate(channels):
-            joint_name = client.JOINT_NAMES[joint_idx]
-            print(f"    {joint_name} (ch {channel}): ", end="", flush=True)
-            
-            # Small movement to verify
-            client.set_servo(channel, 1400)
-            time.sleep(0.3)
-            client.set_servo(channel, 1600)
-            time.sleep(0.3)
-            client.set_servo(channel, 1500)
-            time.sleep(0.2)
-            print("OK")
+        # Small movement to verify; one message, timed by the Brain
+        duration_ms = client.servo_script(script) if use_script else None
+        if duration_ms is not None:
+            time.sleep(duration_ms / 1000.0)
+        else:
+            use_script = False  # Daemon without servo_script: step from here
+            for us, dwell_ms in LEG_JOINT_STEPS:
+                client.set_servo(channel, us)
+                time.sleep(dwell_ms / 1000.0)
+        print("OK")
         
-        time.sleep(0.3)
+        if joint_idx == 2:
+            time.sleep(0.3)
     
     print("\n  Leg test PASSED")
     return True
 
 
+def custom_servo_command(client: SpiderClient):
+    """Prompt for a channel and pulse width and send it."""
+    try:
+        ch = int(input("  Channel (0-11): "))
+        us = int(input("  Position (500-2500 us): "))
+        client.set_servo(ch, us)
+        print(f"  Sent: channel={ch}, us={us}")
+    except ValueError:
+        print("  Invalid input")
+
+
+# Menu choice -> action(client)
+MENU_ACTIONS = {
+    "1": test_single_servo_sweep,
+    "2": test_all_servos_neutral,
+    "3": test_individual_legs,
+    "4": test_estop,
+    "5": test_status,
+    "6": custom_servo_command,
+}
+
+
 def interactive_menu(client: SpiderClient):
     """Interactive test menu."""
     while True:
-        print(f"\n{'='*50}")
+        print("\n" + _BAR50)
         print("Spider Robot v3.1 - Servo Test Menu")
-        print(f"{'='*50}")
+        print(_BAR50)
         print("1. Single servo sweep (channel 0)")
         print("2. All servos to neutral")
         print("3. Test all legs individually")
@@ -152,33 +186,18 @@ def interactive_menu(client: SpiderClient):
         
         if choice == "0":
             break
-        elif choice == "1":
-            test_single_servo_sweep(client)
-        elif choice == "2":
-            test_all_servos_neutral(client)
-        elif choice == "3":
-            test_individual_legs(client)
-        elif choice == "4":
-            test_estop(client)
-        elif choice == "5":
-            test_status(client)
-        elif choice == "6":
-            try:
-                ch = int(input("  Channel (0-11): "))
-                us = int(input("  Position (500-2500 us): "))
-                client.set_servo(ch, us)
-                print(f"  Sent: channel={ch}, us={us}")
-            except ValueError:
-                print("  Invalid input")
+        action = MENU_ACTIONS.get(choice)
+        if action:
+            action(client)
         else:
             print("Invalid choice")
 
 
 def run_all_tests(client: SpiderClient) -> bool:
     """Run all tests in sequence."""
-    print("\n" + "="*60)
+    print("\n" + _BAR60)
     print("SPIDER ROBOT v3.1 - FULL SERVO TEST SUITE")
-    print("="*60)
+    print(_BAR60)
     
     tests = [
         ("Status Query", lambda: test_status(client)),
@@ -202,9 +221,9 @@ def run_all_tests(client: SpiderClient) -> bool:
             failed += 1
             print(f"  *** TEST ERROR: {name} - {e} ***")
     
-    print(f"\n{'='*60}")
+    print("\n" + _BAR60)
     print(f"TEST RESULTS: {passed} passed, {failed} failed")
-    print(f"{'='*60}\n")
+    print(_BAR60 + "\n")
     
     return failed == 0
 
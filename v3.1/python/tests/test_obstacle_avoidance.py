@@ -0,0 +1,33 @@
+"""Tests for ObstacleAvoidance scan analysis (no hardware needed)."""
+
+import re
+from array import array
+
+from obstacle_avoidance import NO_READING, ObstacleAvoidance, ScanData
+
+
+def _scan(distances):
+    angles = [30.0 + i * 120.0 / (len(distances) - 1) for i in range(len(distances))]
+    return ScanData(angles=angles, distances=array('h', distances))
+
+
+def _ascii_best_angle(oa, scan):
+    match = re.search(r"Best direction: ([\d.]+)°", oa.format_scan_ascii(scan))
+    return float(match.group(1))
+
+
+def test_all_invalid_scan_falls_back_to_center():
+    oa = ObstacleAvoidance(client=None)
+    scan = _scan([NO_READING] * 5)
+    
+    assert oa.find_best_direction(scan) == oa.DEFAULT_HEADING
+    assert _ascii_best_angle(oa, scan) == oa.DEFAULT_HEADING
+
+
+def test_mixed_scan_ascii_matches_find_best_direction():
+    oa = ObstacleAvoidance(client=None)
+    scan = _scan([NO_READING, 300, 900, NO_READING, 200])
+    
+    best = oa.find_best_direction(scan)
+    assert best == scan.angles[2]
+    assert _ascii_best_angle(oa, scan) == best
@@ -0,0 +1,57 @@
+"""Tests for SpiderClient connection handling (no Brain needed)."""
+
+import threading
+
+from spider_client import SpiderClient
+
+
+class DeadSocket:
+    """Stands in for websocket.WebSocket on a link that has gone away."""
+    
+    def __init__(self):
+        self.closed = threading.Event()
+    
+    def ping(self):
+        raise ConnectionResetError("Connection reset by peer")
+    
+    def close(self):
+        self.closed.set()
+
+
+def _client_on(ws, monkeypatch, auto_reconnect=True):
+    client = SpiderClient("127.0.0.1", 9000)
+    client.KEEPALIVE_INTERVAL_S = 0.01
+    client.auto_reconnect = auto_reconnect
+    client.ws = ws
+    client.connected = True
+    client._want_connected = True
+    
+    reconnects = threading.Event()
+    
+    def connect():
+        reconnects.set()
+        return False
+    
+    monkeypatch.setattr(client, "connect", connect)
+    return client, reconnects
+
+
+def test_keepalive_failure_marks_disconnected_and_reconnects(monkeypatch):
+    ws = DeadSocket()
+    client, reconnects = _client_on(ws, monkeypatch)
+    
+    client._start_keepalive()
+    
+    assert reconnects.wait(1.0)
+    assert not client.connected
+    assert ws.closed.is_set()  # Old socket dropped before reconnecting
+
+
+def test_keepalive_failure_without_auto_reconnect(monkeypatch):
+    ws = DeadSocket()
+    client, reconnects = _client_on(ws, monkeypatch, auto_reconnect=False)
+    
+    client._start_keepalive()
+    
+    assert not reconnects.wait(0.2)
+    assert not client.connected
@@ -5,6 +5,17 @@ Tests the ToF distance sensor on I2C-2.
 """
 
 import time
+from array import array
+
+try:
+    import smbus2 as smbus
+    from smbus2 import i2c_msg
+except ImportError:
+    i2c_msg = None  # Plain smbus: one transaction per register write
+    try:
+        import smbus
+    except ImportError:
+        smbus = None  # Reported when a sensor is opened
 
 VL53L0X_ADDR = 0x29
 
@@ -13,13 +24,24 @@ REG_IDENTIFICATION_MODEL_ID = 0xC0
 REG_SYSRANGE_START = 0x00
 REG_RESULT_RANGE_STATUS = 0x14
 
+# SYSRANGE_START modes
+SYSRANGE_MODE_SINGLESHOT = 0x01
+SYSRANGE_MODE_BACKTOBACK = 0x02
+
+# Per-reading deadline and status poll interval
+RANGE_TIMEOUT_S = 0.1
+POLL_INTERVAL_S = 0.001
+
+# Distance bars for test_distance, indexed by width (1 char per 20mm), padded to 50
+_BARS = tuple(("#" * n).ljust(50) for n in range(51))
+
 class VL53L0X:
+    __slots__ = ('addr', 'bus')
+
     def __init__(self, bus_num=2, addr=VL53L0X_ADDR):
         self.addr = addr
-        try:
-            import smbus2 as smbus
-        except ImportError:
-            import smbus
+        if smbus is None:
+            raise ImportError("smbus2 not installed. Run: pip install smbus2")
         self.bus = smbus.SMBus(bus_num)
         self._verify_device()
 
@@ -33,6 +55,14 @@ class VL53L0X:
     def _write_byte(self, reg, val):
         self.bus.write_byte_data(self.addr, reg, val)
 
+    def _write_regs(self, pairs):
+        """Write (reg, val) pairs, as one combined I2C transfer with smbus2."""
+        if i2c_msg is not None:
+            self.bus.i2c_rdwr(*[i2c_msg.write(self.addr, pair) for pair in pairs])
+        else:
+            for reg, val in pairs:
+                self._write_byte(reg, val)
+
     def _read_byte(self, reg):
         return self.bus.read_byte_data(self.addr, reg)
 
@@ -43,47 +73,66 @@ class VL53L0X:
     def init_sensor(self):
         """Basic initialization (simplified - full init requires 60+ register writes)."""
         # This is a minimal init. For production, use the ST API sequence.
-        self._write_byte(0x88, 0x00)
-        self._write_byte(0x80, 0x01)
-        self._write_byte(0xFF, 0x01)
-        self._write_byte(0x00, 0x00)
+        self._write_regs(((0x88, 0x00), (0x80, 0x01), (0xFF, 0x01), (0x00, 0x00)))
         time.sleep(0.01)
-        self._write_byte(0x00, 0x01)
-        self._write_byte(0xFF, 0x00)
-        self._write_byte(0x80, 0x00)
+        self._write_regs(((0x00, 0x01), (0xFF, 0x00), (0x80, 0x00)))
         print("VL53L0X basic init complete")
 
     def read_range_single(self):
         """Perform single-shot range measurement."""
         # Start measurement
-        self._write_byte(REG_SYSRANGE_START, 0x01)
+        self._write_byte(REG_SYSRANGE_START, SYSRANGE_MODE_SINGLESHOT)
         
-        # Wait for measurement to complete (bit 0 clears)
-        timeout = 50
-        while timeout > 0:
-            status = self._read_byte(REG_SYSRANGE_START)
-            if (status & 0x01) == 0:
-                break
-            time.sleep(0.01)
-            timeout -= 1
+        # Wait for measurement to complete (bit 0 clears); a ranging cycle
+        # takes ~33ms, so poll often and give up soon after that
+        deadline = time.monotonic() + RANGE_TIMEOUT_S
+        while (self._read_byte(REG_SYSRANGE_START) & 0x01) != 0:
+            if time.monotonic() >= deadline:
+                return -1  # Timeout
+            time.sleep(POLL_INTERVAL_S)
         
-        if timeout == 0:
-            return -1  # Timeout
+        return self._read_result(deadline)
+
+    def start_continuous(self):
+        """Start back-to-back ranging; the sensor re-arms itself after each result."""
+        self._write_byte(REG_SYSRANGE_START, SYSRANGE_MODE_BACKTOBACK)
+
+    def stop_continuous(self):
+        """Return to single-shot mode."""
+        self._write_byte(REG_SYSRANGE_START, SYSRANGE_MODE_SINGLESHOT)
+
+    def read_continuous(self):
+        """Read the next result in continuous mode (no start / start-clear poll)."""
+        return self._read_result(time.monotonic() + RANGE_TIMEOUT_S)
+
+    def read_range_batch(self, n):
+        """
+        Take n back-to-back readings (e.g. for calibration logs).
         
-        # Wait for result ready
-        timeout = 50
-        while timeout > 0:
-            range_status = self._read_byte(REG_RESULT_RANGE_STATUS)
-            if (range_status & 0x01):
+        Returns a compact signed 16-bit array of ranges in mm, with the
+        negative error codes of read_range_single for failed readings.
+        """
+        readings = array('h', bytes(2 * n))
+        self.start_continuous()
+        try:
+            for i in range(n):
+                readings[i] = self.read_continuous()
+        finally:
+            self.stop_continuous()
+        return readings
+
+    def _read_result(self, deadline):
+        # Wait for result ready; each poll reads the whole result block, so
+        # the final poll already carries the range (one transaction, not two)
+        while True:
+            result = self.bus.read_i2c_block_data(self.addr, REG_RESULT_RANGE_STATUS, 12)
+            if (result[0] & 0x01):
                 break
-            time.sleep(0.01)
-            timeout -= 1
-        
-        if timeout == 0:
-            return -2  # Result timeout
+            if time.monotonic() >= deadline:
+                return -2  # Result timeout
+            time.sleep(POLL_INTERVAL_S)
         
-        # Read range value
-        range_mm = self._read_word(REG_RESULT_RANGE_STATUS + 10)
+        range_mm = (result[10] << 8) | result[11]
         
         # Clear interrupt
         self._write_byte(0x0B, 0x01)
@@ -103,19 +152,21 @@ def test_distance():
         return False
 
     print("\nReading distance (Ctrl+C to stop)...\n")
+    sensor.start_continuous()
     try:
         while True:
-            dist = sensor.read_range_single()
+            dist = sensor.read_continuous()
             if dist < 0:
                 print(f"Error: {dist}")
             elif dist > 2000:
                 print("Out of range (>2m)")
             else:
-                bar = "#" * min(50, dist // 20)
-                print(f"\r{dist:4d} mm  [{bar:<50}]", end="", flush=True)
+                print(f"\r{dist:4d} mm  [{_BARS[min(50, dist // 20)]}]", end="", flush=True)
             time.sleep(0.1)
     except KeyboardInterrupt:
         print("\n\nStopped")
+    finally:
+        sensor.stop_continuous()
     
     return True
 
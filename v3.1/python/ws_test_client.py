@@ -1,56 +1,102 @@
 #!/usr/bin/env python3
-"""WebSocket test client for Spider Brain Daemon."""
+"""WebSocket test client for Spider Brain Daemon.
+
+Set WS_TEST_RUNS=N to repeat the command sequence N times on one connection,
+WS_VERBOSE=1 to pretty-print replies (printed raw otherwise).
+"""
 
 import asyncio
+import os
 import websockets
 import json
 
+# Optional fast JSON codec; falls back to stdlib json
+try:
+    import orjson
+    
+    def _pretty(resp) -> str:
+        return orjson.dumps(orjson.loads(resp), option=orjson.OPT_INDENT_2).decode()
+except ImportError:
+    orjson = None
+    
+    def _pretty(resp) -> str:
+        return json.dumps(json.loads(resp), indent=2)
+
+# Replies are re-parsed and indented only with WS_VERBOSE=1
+VERBOSE = os.getenv("WS_VERBOSE", "0") == "1"
+
 DUO_IP = "192.168.42.1"
 WS_PORT = 8080  # C++ daemon uses 8080
 
-async def test():
+# (label, message) sent at startup: status, stand, lidar, then a brief walk
+STARTUP_COMMANDS = [
+    ("status", '{"cmd":"status"}'),
+    ("pose: stand", '{"cmd":"pose","pose":"stand"}'),
+    ("lidar", '{"cmd":"lidar"}'),
+    ("gait: walk", '{"cmd":"gait","gait":"walk","speed":80}'),
+]
+
+# Max wait for status to report the walk gait running before sending stop
+GAIT_START_TIMEOUT_S = 2.0
+
+def _print_reply(resp: bytes):
+    print(_pretty(resp) if VERBOSE else resp.decode())
+
+async def run_commands(ws):
+    """Run the command sequence on an already open connection."""
+    # Pipelined: send every startup command back to back, then read the
+    # replies (the daemon answers in order) instead of one round trip each
+    for _, msg in STARTUP_COMMANDS:
+        await ws.send(msg)
+    for i, (label, _) in enumerate(STARTUP_COMMANDS):
+        resp = await ws.recv(decode=False)  # Raw bytes; JSON parser takes them as-is
+        print(f">>> {label}")
+        _print_reply(resp)
+        if i < len(STARTUP_COMMANDS) - 1:
+            print()
+    
+    # Wait until the daemon reports the gait running (not a fixed 2s)
+    print("\n>>> status (until gait_running)")
+    loop = asyncio.get_running_loop()
+    deadline = loop.time() + GAIT_START_TIMEOUT_S
+    while True:
+        await ws.send('{"cmd":"status"}')
+        st = json.loads(await ws.recv(decode=False))
+        if st.get("gait_running"):
+            print("gait running")
+            break
+        if loop.time() >= deadline:
+            print(f"gait not reported running after {GAIT_START_TIMEOUT_S}s")
+            break
+        await asyncio.sleep(0.05)
+    
+    # Stop
+    print("\n>>> stop")
+    await ws.send('{"cmd":"stop"}')
+    resp = await ws.recv(decode=False)
+    _print_reply(resp)
+
+async def test(runs: int = 1):
+    """Connect once and run the command sequence runs times on that connection."""
     uri = f"ws://{DUO_IP}:{WS_PORT}"
     print(f"Connecting to {uri}...")
     
-    async with websockets.connect(uri) as ws:
+    # Tiny LAN frames: permessage-deflate costs more CPU than it saves
+    async with websockets.connect(uri, compression=None) as ws:
         print("Connected!\n")
         
-        # Test status
-        print(">>> status")
-        await ws.send('{"cmd":"status"}')
-        resp = await ws.recv()
-        print(json.dumps(json.loads(resp), indent=2))
-        print()
-        
-        # Test pose
-        print(">>> pose: stand")
-        await ws.send('{"cmd":"pose","pose":"stand"}')
-        resp = await ws.recv()
-        print(json.dumps(json.loads(resp), indent=2))
-        print()
-        
-        # Test lidar
-        print(">>> lidar")
-        await ws.send('{"cmd":"lidar"}')
-        resp = await ws.recv()
-        print(json.dumps(json.loads(resp), indent=2))
-        print()
-        
-        # Test walk (brief)
-        print(">>> gait: walk")
-        await ws.send('{"cmd":"gait","gait":"walk","speed":80}')
-        resp = await ws.recv()
-        print(json.dumps(json.loads(resp), indent=2))
-        
-        await asyncio.sleep(2)
-        
-        # Stop
-        print("\n>>> stop")
-        await ws.send('{"cmd":"stop"}')
-        resp = await ws.recv()
-        print(json.dumps(json.loads(resp), indent=2))
+        for run in range(runs):
+            if run:
+                print(f"\n--- run {run + 1}/{runs} ---\n")
+            await run_commands(ws)
         
         print("\nTest complete!")
 
 if __name__ == "__main__":
-    asyncio.run(test())
+    # Optional libuv event loop (Linux/macOS); default asyncio loop otherwise
+    try:
+        import uvloop
+        uvloop.install()
+    except ImportError:
+        pass
+    asyncio.run(test(int(os.getenv("WS_TEST_RUNS", "1"))))